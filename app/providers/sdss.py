@@ -183,8 +183,9 @@ def _build_hit(payload: dict, query: ProviderQuery, target: _TargetInfo) -> Prov
         identifier=identifier,
         label=f"{target.label}",
         summary=summary,
-        wavelengths_nm=[float(value) for value in wavelengths],
-        flux=[float(value) for value in flux],
+        # fetch() already emits Python floats via ndarray.tolist().
+        wavelengths_nm=list(wavelengths),
+        flux=list(flux),
         metadata=metadata,
         provenance=provenance,
     )
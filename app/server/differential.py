@@ -5,8 +5,13 @@ def _to_sorted_arrays(wavelengths, fluxes):
     wavelengths = np.asarray(wavelengths, dtype=float)
     fluxes = np.asarray(fluxes, dtype=float)
 
-    order = np.argsort(wavelengths)
-    return wavelengths[order], fluxes[order]
+    # Spectra almost always arrive in ascending order; a linear check spares
+    # the sort and the two gathers for them.
+    if wavelengths.size > 1 and not (wavelengths[1:] >= wavelengths[:-1]).all():
+        order = np.argsort(wavelengths, kind="stable")
+        wavelengths = wavelengths[order]
+        fluxes = fluxes[order]
+    return wavelengths, fluxes
 
 
 def resample_to_common_grid(wl_a, fl_a, wl_b, fl_b, n=2000):
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
-import math
+import json
 import re
-from dataclasses import dataclass
+import threading
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from functools import lru_cache
 from html import unescape
-from typing import Dict, Mapping, Optional, Sequence, Tuple
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
 from urllib.parse import urljoin
 
 import numpy as np
 import requests
 from astropy import units as u
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..ingest_jcamp import parse_jcamp
 
@@ -18,8 +25,10 @@ __all__ = [
     "DEFAULT_RESOLUTION_CM_1",
     "QuantIRFetchError",
     "available_species",
+    "configure_session",
     "manual_species_catalog",
     "fetch",
+    "fetch_many",
 ]
 
 
@@ -37,33 +46,133 @@ DEFAULT_APODIZATION_PRIORITY: Tuple[str, ...] = (
 STANDARD_ATMOSPHERE = 101325.0 * u.Pa
 _JCAMP_PATTERN = re.compile(r"display_jcamp\('([^']+)'", re.IGNORECASE)
 _RELATIVE_UNCERTAINTY_PATTERN = re.compile(r"([-+]?\d*\.?\d+)")
-_DELTA_X_PATTERN = re.compile(r"##DELTAX\s*=\s*([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)", re.IGNORECASE)
+_DELTA_X_PATTERN = re.compile(rb"##DELTAX\s*=\s*([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)", re.IGNORECASE)
+_JCAMP_HEADER_SCAN_BYTES = 4096
+_CATALOG_TABLE_PATTERN = re.compile(
+    r"<table\b[^>]*\bclass\s*=\s*[\"']?(?:[^\"'>]*\s)?list(?=[\s\"'>])(?:\s[^\"'>]*)?[\"']?[^>]*>(.*?)</table\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_TABLE_OPEN_PATTERN = re.compile(r"<table\b", re.IGNORECASE)
+_ROW_PATTERN = re.compile(r"<tr\b[^>]*>(.*?)</tr\s*>", re.IGNORECASE | re.DOTALL)
+_ROW_OPEN_PATTERN = re.compile(r"<tr\b", re.IGNORECASE)
+_CELL_PATTERN = re.compile(r"<td\b([^>]*)>(.*?)</td\s*>", re.IGNORECASE | re.DOTALL)
+_CELL_OPEN_PATTERN = re.compile(r"<td\b", re.IGNORECASE)
+_LINK_PATTERN = re.compile(r"<a\b([^>]*)>(.*?)</a\s*>", re.IGNORECASE | re.DOTALL)
+_LINK_OPEN_PATTERN = re.compile(r"<a\b", re.IGNORECASE)
+_HREF_PATTERN = re.compile(r"\bhref\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))", re.IGNORECASE)
+_ROWSPAN_PATTERN = re.compile(r"\browspan\b", re.IGNORECASE)
+_TAG_PATTERN = re.compile(r"<[^>]*>")
+_TOKEN_STRIP_PATTERN = re.compile(r"[^a-z0-9]+")
+_RESOLUTION_KEY_SCALE = 1_000_000
+_CATALOG_CACHE_SCHEMA = 1
+_CATALOG_CACHE_PATH = (
+    Path(__file__).resolve().parents[3] / "data" / "providers" / "nist" / "quant_ir_catalog.json"
+)
+_SESSION_POOL_CONNECTIONS = 4
+_SESSION_POOL_MAXSIZE = 16
+_SESSION_LOCK = threading.Lock()
+_DEFAULT_SESSION: Optional[requests.Session] = None
 
 
 class QuantIRFetchError(RuntimeError):
     """Raised when a NIST Quantitative IR request cannot be satisfied."""
 
 
-@dataclass(frozen=True)
+def _resolution_key(value: float) -> int:
+    # Catalog resolutions are short decimal labels ("0.125"), so quantising to
+    # micro-cm⁻¹ turns float matching into an exact integer lookup.
+    return round(float(value) * _RESOLUTION_KEY_SCALE)
+
+
+@dataclass(frozen=True, slots=True)
 class QuantIRMeasurement:
     apodization: str
     resolution_links: Mapping[float, str]
+    resolutions_sorted: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    resolution_index: Mapping[int, Tuple[float, str]] = field(
+        init=False, repr=False, compare=False
+    )
+    normalised_apodization: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "normalised_apodization", _normalise_token(self.apodization))
+        object.__setattr__(self, "resolutions_sorted", tuple(sorted(self.resolution_links)))
+        object.__setattr__(
+            self,
+            "resolution_index",
+            {
+                _resolution_key(value): (value, href)
+                for value, href in self.resolution_links.items()
+            },
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuantIRSpecies:
     name: str
     relative_uncertainty: str
     measurements: Tuple[QuantIRMeasurement, ...]
+    sort_key: str = field(init=False, repr=False, compare=False)
+    measurements_by_apodization: Mapping[str, Tuple[QuantIRMeasurement, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "sort_key", self.name.lower())
+        grouped: Dict[str, Tuple[QuantIRMeasurement, ...]] = {}
+        for measurement in self.measurements:
+            key = measurement.normalised_apodization
+            grouped[key] = grouped.get(key, ()) + (measurement,)
+        object.__setattr__(self, "measurements_by_apodization", grouped)
 
 
+@lru_cache(maxsize=512)
 def _normalise_token(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", (value or "").lower())
+    return _TOKEN_STRIP_PATTERN.sub("", (value or "").lower())
+
+
+_NORMALISED_DEFAULT_PRIORITY: Tuple[str, ...] = tuple(
+    _normalise_token(item) for item in DEFAULT_APODIZATION_PRIORITY
+)
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_SESSION_POOL_CONNECTIONS,
+        pool_maxsize=_SESSION_POOL_MAXSIZE,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _default_session() -> requests.Session:
+    global _DEFAULT_SESSION
+    with _SESSION_LOCK:
+        if _DEFAULT_SESSION is None:
+            _DEFAULT_SESSION = _build_session()
+        return _DEFAULT_SESSION
+
+
+def configure_session(session: Optional[requests.Session] = None) -> None:
+    """Replace the pooled session used when callers do not supply one.
+
+    Passing ``None`` discards the current session so the next request builds a
+    fresh keep-alive pool.
+    """
+
+    global _DEFAULT_SESSION
+    with _SESSION_LOCK:
+        previous, _DEFAULT_SESSION = _DEFAULT_SESSION, session
+    if previous is not None and previous is not session:
+        previous.close()
 
 
 def _download_text(url: str, *, session: Optional[requests.Session] = None) -> str:
     try:
-        response = (session or requests).get(url, timeout=REQUEST_TIMEOUT)
+        response = (session or _default_session()).get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
     except requests.RequestException as exc:  # pragma: no cover - defensive branch
         raise QuantIRFetchError(f"Failed to download {url}: {exc}") from exc
@@ -72,13 +181,57 @@ def _download_text(url: str, *, session: Optional[requests.Session] = None) -> s
     return response.text
 
 
-def _download_bytes(url: str, *, session: Optional[requests.Session] = None) -> bytes:
+def _preallocated_length(response: requests.Response) -> int:
+    # Content-Length only matches the decoded body when no transfer encoding
+    # such as gzip is applied.
+    if response.headers.get("Content-Encoding", "identity").lower() != "identity":
+        return 0
     try:
-        response = (session or requests).get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
+        return max(0, int(response.headers.get("Content-Length", 0)))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _read_body(response: requests.Response) -> bytearray:
+    expected = _preallocated_length(response)
+    buffer = bytearray(expected)
+    offset = 0
+    overflow = b""
+    chunks = iter(response.iter_content(chunk_size=65536))
+    with memoryview(buffer) as view:
+        for chunk in chunks:
+            end = offset + len(chunk)
+            if end > expected:
+                overflow = chunk
+                break
+            view[offset:end] = chunk
+            offset = end
+    del buffer[offset:]
+    if overflow:
+        # More bytes than advertised (or no Content-Length): append the rest.
+        buffer += overflow
+        for chunk in chunks:
+            buffer += chunk
+    return buffer
+
+
+def _download_bytes(url: str, *, session: Optional[requests.Session] = None) -> bytearray:
+    try:
+        with (session or _default_session()).get(
+            url, stream=True, timeout=REQUEST_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            return _read_body(response)
     except requests.RequestException as exc:  # pragma: no cover - defensive branch
         raise QuantIRFetchError(f"Failed to download {url}: {exc}") from exc
-    return response.content
+
+
+def _owned_dict(value: object) -> Dict[str, object]:
+    # Payload sections built by parse_jcamp are already private dicts, so update
+    # them in place and only copy foreign mappings.
+    if isinstance(value, dict):
+        return value
+    return dict(value or {})  # type: ignore[call-overload]
 
 
 def _first_unit(*candidates: object) -> Optional[str]:
@@ -106,7 +259,7 @@ def _annotate_axis_units(
         working_provenance = provenance
 
     units_meta_raw = working_provenance.get("units") if isinstance(working_provenance.get("units"), Mapping) else None
-    units_meta: Dict[str, object] = dict(units_meta_raw or {})
+    units_meta = _owned_dict(units_meta_raw)
 
     reported_unit = _first_unit(
         working_metadata.get("wavelength_display_unit"),
@@ -137,31 +290,27 @@ def _annotate_axis_units(
 
     return working_metadata, working_provenance
 
-def _parse_catalog(html: str) -> Dict[str, QuantIRSpecies]:
-    try:
-        from bs4 import BeautifulSoup
-    except ImportError as exc:  # pragma: no cover - defensive branch
-        raise QuantIRFetchError("beautifulsoup4 is required to parse the Quant IR catalog") from exc
 
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.find("table", {"class": "list"})
-    if table is None:
-        raise QuantIRFetchError("Could not locate Quant IR species table")
+def _cell_text(tag: object) -> str:
+    # Catalog cells usually hold a single text node; reading it directly avoids
+    # the descendant walk and join performed by get_text().
+    string = getattr(tag, "string", None)
+    if string is not None:
+        return str(string).strip()
+    return tag.get_text(strip=True)  # type: ignore[attr-defined]
 
-    rows = table.find_all("tr")
-    if len(rows) <= 1:
-        raise QuantIRFetchError("Quant IR species table contained no data")
 
+_CatalogRow = Tuple[Optional[Tuple[str, str]], Optional[str], Iterable[Tuple[Optional[str], str]]]
+
+
+def _assemble_catalog(rows: Iterable[_CatalogRow]) -> Dict[str, QuantIRSpecies]:
     catalog: Dict[str, QuantIRSpecies] = {}
     current_name: Optional[str] = None
     current_uncertainty: str = ""
     current_measurements: list[QuantIRMeasurement] = []
 
-    for row in rows[1:]:
-        cells = row.find_all("td")
-        if not cells:
-            continue
-        if cells[0].has_attr("rowspan"):
+    for lead, apodization, links in rows:
+        if lead is not None:
             if current_name is not None:
                 catalog[_normalise_token(current_name)] = QuantIRSpecies(
                     name=current_name,
@@ -169,21 +318,11 @@ def _parse_catalog(html: str) -> Dict[str, QuantIRSpecies]:
                     measurements=tuple(current_measurements),
                 )
                 current_measurements = []
-            current_name = cells[0].get_text(strip=True)
-            current_uncertainty = cells[1].get_text(strip=True)
-            data_cells = cells[2:]
-        else:
-            data_cells = cells
-        if len(data_cells) < 2 or current_name is None:
+            current_name, current_uncertainty = lead
+        if apodization is None or current_name is None:
             continue
-        apod_cell = data_cells[0]
-        resolution_cell = data_cells[1]
-        apodization = apod_cell.get_text(strip=True)
-        links = resolution_cell.find_all("a")
         resolutions: Dict[float, str] = {}
-        for link in links:
-            href = link.get("href")
-            label = link.get_text(strip=True)
+        for href, label in links:
             if not href or not label:
                 continue
             try:
@@ -194,7 +333,9 @@ def _parse_catalog(html: str) -> Dict[str, QuantIRSpecies]:
         if not resolutions:
             continue
         current_measurements.append(
-            QuantIRMeasurement(apodization=apodization, resolution_links=dict(resolutions))
+            QuantIRMeasurement(
+                apodization=apodization, resolution_links=MappingProxyType(resolutions)
+            )
         )
 
     if current_name is not None and current_measurements:
@@ -207,13 +348,224 @@ def _parse_catalog(html: str) -> Dict[str, QuantIRSpecies]:
     return catalog
 
 
+def _fragment_text(fragment: str) -> str:
+    return "".join(unescape(part).strip() for part in _TAG_PATTERN.split(fragment))
+
+
+def _fragment_href(attributes: str) -> Optional[str]:
+    match = _HREF_PATTERN.search(attributes)
+    if match is None:
+        return None
+    return unescape(next(group for group in match.groups() if group is not None))
+
+
+def _catalog_rows_regex(html: str) -> Optional[list[_CatalogRow]]:
+    """Extract catalog rows straight from the markup, or ``None`` if it is unusual.
+
+    The Quant IR listing is a flat, well-formed table. Anything this scanner
+    cannot account for tag-for-tag (nested tables, comments, unclosed cells)
+    returns ``None`` so the caller can fall back to BeautifulSoup.
+    """
+
+    table_match = _CATALOG_TABLE_PATTERN.search(html)
+    if table_match is None:
+        return None
+    body = table_match.group(1)
+    if "<!--" in body or _TABLE_OPEN_PATTERN.search(body):
+        return None
+
+    row_matches = _ROW_PATTERN.findall(body)
+    if len(row_matches) <= 1 or len(row_matches) != len(_ROW_OPEN_PATTERN.findall(body)):
+        return None
+
+    rows: list[_CatalogRow] = []
+    for row in row_matches[1:]:
+        cells = _CELL_PATTERN.findall(row)
+        if len(cells) != len(_CELL_OPEN_PATTERN.findall(row)):
+            return None
+        if not cells:
+            continue
+        lead: Optional[Tuple[str, str]] = None
+        if _ROWSPAN_PATTERN.search(cells[0][0]):
+            if len(cells) < 2:
+                return None
+            lead = (_fragment_text(cells[0][1]), _fragment_text(cells[1][1]))
+            data_cells = cells[2:]
+        else:
+            data_cells = cells
+        if len(data_cells) < 2:
+            rows.append((lead, None, ()))
+            continue
+        resolution_html = data_cells[1][1]
+        link_matches = _LINK_PATTERN.findall(resolution_html)
+        if len(link_matches) != len(_LINK_OPEN_PATTERN.findall(resolution_html)):
+            return None
+        links = [
+            (_fragment_href(attributes), _fragment_text(label))
+            for attributes, label in link_matches
+        ]
+        rows.append((lead, _fragment_text(data_cells[0][1]), links))
+    return rows
+
+
+def _catalog_rows_bs(html: str) -> list[_CatalogRow]:
+    try:
+        from bs4 import BeautifulSoup, FeatureNotFound
+    except ImportError as exc:  # pragma: no cover - defensive branch
+        raise QuantIRFetchError("beautifulsoup4 is required to parse the Quant IR catalog") from exc
+
+    try:
+        soup = BeautifulSoup(html, "lxml")
+    except FeatureNotFound:
+        soup = BeautifulSoup(html, "html.parser")
+    table = soup.find("table", {"class": "list"})
+    if table is None:
+        raise QuantIRFetchError("Could not locate Quant IR species table")
+
+    table_rows = table.find_all("tr")
+    if len(table_rows) <= 1:
+        raise QuantIRFetchError("Quant IR species table contained no data")
+
+    rows: list[_CatalogRow] = []
+    for row in table_rows[1:]:
+        cells = row.find_all("td")
+        if not cells:
+            continue
+        lead: Optional[Tuple[str, str]] = None
+        if cells[0].has_attr("rowspan"):
+            lead = (_cell_text(cells[0]), _cell_text(cells[1]))
+            data_cells = cells[2:]
+        else:
+            data_cells = cells
+        if len(data_cells) < 2:
+            rows.append((lead, None, ()))
+            continue
+        links = [
+            (link.get("href"), _cell_text(link)) for link in data_cells[1].find_all("a")
+        ]
+        rows.append((lead, _cell_text(data_cells[0]), links))
+    return rows
+
+
+def _parse_catalog_bs(html: str) -> Dict[str, QuantIRSpecies]:
+    return _assemble_catalog(_catalog_rows_bs(html))
+
+
+def _parse_catalog(html: str) -> Dict[str, QuantIRSpecies]:
+    rows = _catalog_rows_regex(html)
+    if rows:
+        catalog = _assemble_catalog(rows)
+        if catalog:
+            return catalog
+    return _parse_catalog_bs(html)
+
+
+def _catalog_to_json(catalog: Mapping[str, QuantIRSpecies]) -> list[Dict[str, object]]:
+    return [
+        {
+            "key": key,
+            "name": species.name,
+            "relative_uncertainty": species.relative_uncertainty,
+            "measurements": [
+                {
+                    "apodization": measurement.apodization,
+                    "resolution_links": [
+                        [value, href] for value, href in measurement.resolution_links.items()
+                    ],
+                }
+                for measurement in species.measurements
+            ],
+        }
+        for key, species in catalog.items()
+    ]
+
+
+def _catalog_from_json(entries: Sequence[Mapping[str, object]]) -> Dict[str, QuantIRSpecies]:
+    catalog: Dict[str, QuantIRSpecies] = {}
+    for entry in entries:
+        measurements = tuple(
+            QuantIRMeasurement(
+                apodization=str(measurement["apodization"]),
+                resolution_links={
+                    float(value): str(href) for value, href in measurement["resolution_links"]
+                },
+            )
+            for measurement in entry["measurements"]  # type: ignore[union-attr]
+        )
+        catalog[str(entry["key"])] = QuantIRSpecies(
+            name=str(entry["name"]),
+            relative_uncertainty=str(entry["relative_uncertainty"]),
+            measurements=measurements,
+        )
+    return catalog
+
+
+def _read_catalog_cache(path: Path) -> Optional[Dict[str, object]]:
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(document, dict) or document.get("schema") != _CATALOG_CACHE_SCHEMA:
+        return None
+    try:
+        document["catalog"] = _catalog_from_json(document.get("species") or [])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return document
+
+
+def _write_catalog_cache(
+    path: Path,
+    catalog: Mapping[str, QuantIRSpecies],
+    *,
+    etag: Optional[str],
+    last_modified: Optional[str],
+) -> None:
+    document = {
+        "schema": _CATALOG_CACHE_SCHEMA,
+        "source": CATALOG_URL,
+        "etag": etag,
+        "last_modified": last_modified,
+        "species": _catalog_to_json(catalog),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding="utf-8")
+    except OSError:  # pragma: no cover - cache is best effort
+        pass
+
+
 @lru_cache(maxsize=1)
-def _cached_catalog() -> Dict[str, QuantIRSpecies]:
+def _cached_catalog() -> Mapping[str, QuantIRSpecies]:
+    """Return the live catalog, revalidating a disk snapshot with a conditional GET."""
+
+    cached = _read_catalog_cache(_CATALOG_CACHE_PATH)
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = str(cached["etag"])
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = str(cached["last_modified"])
+
     try:
-        html = _download_text(CATALOG_URL)
-    except QuantIRFetchError:
+        response = _default_session().get(CATALOG_URL, headers=headers, timeout=REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached is not None:
+            return _merge_manual_species(cached["catalog"])  # type: ignore[arg-type]
+        response.raise_for_status()
+    except requests.RequestException:
+        if cached is not None:
+            return _merge_manual_species(cached["catalog"])  # type: ignore[arg-type]
         return dict(_MANUAL_SPECIES_CATALOG)
-    parsed = _parse_catalog(html)
+
+    if not response.encoding:
+        response.encoding = "utf-8"
+    parsed = _parse_catalog(response.text)
+    _write_catalog_cache(
+        _CATALOG_CACHE_PATH,
+        parsed,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
     return _merge_manual_species(parsed)
 
 
@@ -228,15 +580,25 @@ def manual_species_catalog() -> Dict[str, QuantIRSpecies]:
 
 
 def _merge_manual_species(
-    catalog: Mapping[str, QuantIRSpecies]
-) -> Dict[str, QuantIRSpecies]:
-    merged = dict(catalog)
-    for key, species in _MANUAL_SPECIES_CATALOG.items():
-        merged.setdefault(key, species)
-    return merged
+    catalog: Dict[str, QuantIRSpecies]
+) -> Mapping[str, QuantIRSpecies]:
+    # Parsed entries take precedence; the manual table is layered underneath
+    # rather than copied so each fresh catalog load skips an O(N) merge.
+    # Manual aliases (formula, CAS number) of species the live catalog also
+    # lists resolve to the parsed record rather than the manual fallback.
+    alias_index: Dict[str, QuantIRSpecies] = {}
+    for record in _MANUAL_SPECIES_RECORDS:
+        parsed = catalog.get(_normalise_token(record.name))
+        if parsed is None:
+            continue
+        for token in record.tokens:
+            normalised = _normalise_token(token)
+            if normalised and normalised not in catalog:
+                alias_index[normalised] = parsed
+    return ChainMap(catalog, alias_index, _MANUAL_SPECIES_CATALOG)
 
 
-def _load_catalog(*, session: Optional[requests.Session] = None) -> Dict[str, QuantIRSpecies]:
+def _load_catalog(*, session: Optional[requests.Session] = None) -> Mapping[str, QuantIRSpecies]:
     if session is not None:
         try:
             html = _download_text(CATALOG_URL, session=session)
@@ -250,8 +612,8 @@ def available_species(*, session: Optional[requests.Session] = None) -> Tuple[Di
     catalog = _load_catalog(session=session)
     entries: list[Dict[str, object]] = []
     seen_names: set[str] = set()
-    for species in sorted(catalog.values(), key=lambda item: item.name.lower()):
-        key = species.name.lower()
+    for species in sorted(catalog.values(), key=lambda item: item.sort_key):
+        key = species.sort_key
         if key in seen_names:
             continue
         seen_names.add(key)
@@ -262,7 +624,7 @@ def available_species(*, session: Optional[requests.Session] = None) -> Tuple[Di
                 "measurements": [
                     {
                         "apodization": measurement.apodization,
-                        "resolutions_cm_1": sorted(measurement.resolution_links.keys()),
+                        "resolutions_cm_1": list(measurement.resolutions_sorted),
                     }
                     for measurement in species.measurements
                 ],
@@ -276,23 +638,25 @@ def _choose_measurement(
     resolution_cm_1: float,
     priority: Sequence[str],
 ) -> Tuple[QuantIRMeasurement, float, str]:
-    target = float(resolution_cm_1)
-    normalised_priority = [_normalise_token(item) for item in priority]
+    target_key = _resolution_key(resolution_cm_1)
+    if priority is DEFAULT_APODIZATION_PRIORITY:
+        normalised_priority = _NORMALISED_DEFAULT_PRIORITY
+    else:
+        normalised_priority = tuple(_normalise_token(item) for item in priority)
+    by_apodization = species.measurements_by_apodization
 
     for candidate_name in normalised_priority:
         if not candidate_name:
             continue
-        for measurement in species.measurements:
-            if _normalise_token(measurement.apodization) != candidate_name:
-                continue
-            for value, href in measurement.resolution_links.items():
-                if math.isclose(value, target, rel_tol=1e-9, abs_tol=1e-9):
-                    return measurement, value, href
+        for measurement in by_apodization.get(candidate_name, ()):
+            match = measurement.resolution_index.get(target_key)
+            if match is not None:
+                return measurement, match[0], match[1]
 
     for measurement in species.measurements:
-        for value, href in measurement.resolution_links.items():
-            if math.isclose(value, target, rel_tol=1e-9, abs_tol=1e-9):
-                return measurement, value, href
+        match = measurement.resolution_index.get(target_key)
+        if match is not None:
+            return measurement, match[0], match[1]
 
     raise QuantIRFetchError(
         f"{species.name} does not provide a {resolution_cm_1} cm⁻¹ measurement in the Quant IR catalog."
@@ -312,12 +676,29 @@ def _extract_jcamp_url(page_html: str, page_url: str) -> str:
     raise QuantIRFetchError("Could not locate JCAMP link on Quant IR spectrum page")
 
 
-def _extract_delta_x(jcamp_bytes: bytes) -> Optional[float]:
-    try:
-        text = jcamp_bytes.decode("latin-1", errors="ignore")
-    except Exception:  # pragma: no cover - extremely defensive
-        return None
-    match = _DELTA_X_PATTERN.search(text)
+def _download_spectrum(
+    page_url: str, *, session: Optional[requests.Session] = None
+) -> Tuple[str, bytearray]:
+    if "JCAMP=" in page_url:
+        # Manual WebBook links point straight at the JCAMP export, so the page
+        # download already is the spectrum; avoid requesting it a second time.
+        page_bytes = _download_bytes(page_url, session=session)
+        page_html = page_bytes.decode("latin-1", errors="ignore")
+        jcamp_url = _extract_jcamp_url(page_html, page_url)
+        if jcamp_url == page_url:
+            return jcamp_url, page_bytes
+    else:
+        page_html = _download_text(page_url, session=session)
+        jcamp_url = _extract_jcamp_url(page_html, page_url)
+    return jcamp_url, _download_bytes(jcamp_url, session=session)
+
+
+def _extract_delta_x(jcamp_bytes: bytes | bytearray) -> Optional[float]:
+    # ##DELTAX= sits in the JCAMP header, so scan the leading bytes first and
+    # only fall back to the full payload for unusually long headers.
+    match = _DELTA_X_PATTERN.search(jcamp_bytes, 0, _JCAMP_HEADER_SCAN_BYTES)
+    if match is None and len(jcamp_bytes) > _JCAMP_HEADER_SCAN_BYTES:
+        match = _DELTA_X_PATTERN.search(jcamp_bytes)
     if not match:
         return None
     try:
@@ -326,12 +707,30 @@ def _extract_delta_x(jcamp_bytes: bytes) -> Optional[float]:
         return None
 
 
+def _wavelength_array(payload: Mapping[str, object]) -> Optional[np.ndarray]:
+    wavelengths_nm = payload.get("wavelength_nm")
+    if not isinstance(wavelengths_nm, (list, tuple, np.ndarray)) or not len(wavelengths_nm):
+        return None
+    # parse_jcamp keeps the nm Quantity next to the list; reading its buffer
+    # avoids unboxing the list back into floats.
+    quantity = payload.get("wavelength_quantity")
+    if isinstance(quantity, u.Quantity) and quantity.shape == (len(wavelengths_nm),):
+        try:
+            return np.asarray(quantity.to_value(u.nm), dtype=float)
+        except u.UnitConversionError:
+            pass
+    try:
+        return np.asarray(wavelengths_nm, dtype=float)
+    except Exception:
+        return None
+
+
 def _finalise_payload(payload: Dict[str, object]) -> None:
     metadata_raw = payload.get("metadata")
     provenance_raw = payload.get("provenance")
 
-    metadata = dict(metadata_raw or {})
-    provenance = dict(provenance_raw or {})
+    metadata = _owned_dict(metadata_raw)
+    provenance = _owned_dict(provenance_raw)
 
     metadata, provenance = _annotate_axis_units(payload, metadata, provenance)
 
@@ -352,16 +751,11 @@ def _finalise_payload(payload: Dict[str, object]) -> None:
         units_meta.setdefault("wavelength_display", metadata["wavelength_unit"])
         units_meta.setdefault("wavelength_original", metadata["wavelength_unit"])
 
-    wavelengths_nm = payload.get("wavelength_nm")
-    if isinstance(wavelengths_nm, (list, tuple)) and wavelengths_nm:
-        try:
-            array = np.asarray(wavelengths_nm, dtype=float)
-        except Exception:
-            array = None
-        if array is not None and array.size:
-            with np.errstate(divide="ignore", invalid="ignore"):
-                converted = np.where(array != 0.0, 1e7 / array, np.nan)
-            payload.setdefault("wavenumber_cm_1", converted.tolist())
+    array = _wavelength_array(payload)
+    if array is not None and array.size:
+        converted = np.full(array.shape, np.nan)
+        np.divide(1e7, array, out=converted, where=array != 0.0)
+        payload.setdefault("wavenumber_cm_1", converted.tolist())
 
     payload["metadata"] = metadata
     payload["provenance"] = provenance
@@ -395,7 +789,7 @@ def _percent_transmittance(
 
 def _prepare_flux(payload: Dict[str, object], *, manual_entry: bool) -> None:
     flux = payload.get("flux")
-    if not isinstance(flux, (list, tuple)):
+    if not isinstance(flux, (list, tuple, np.ndarray)):
         return
 
     try:
@@ -409,8 +803,8 @@ def _prepare_flux(payload: Dict[str, object], *, manual_entry: bool) -> None:
     metadata_raw = payload.get("metadata")
     provenance_raw = payload.get("provenance")
 
-    metadata = dict(metadata_raw or {})
-    provenance = dict(provenance_raw or {})
+    metadata = _owned_dict(metadata_raw)
+    provenance = _owned_dict(provenance_raw)
 
     reported_unit = metadata.get("reported_flux_unit") if isinstance(metadata_raw, Mapping) else None
 
@@ -441,7 +835,7 @@ def _prepare_flux(payload: Dict[str, object], *, manual_entry: bool) -> None:
             if not isinstance(tier, Mapping):
                 continue
             samples = tier.get("flux")
-            if not isinstance(samples, (list, tuple)):
+            if not isinstance(samples, (list, tuple, np.ndarray)):
                 continue
             try:
                 tier_array = np.asarray(samples, dtype=float)
@@ -512,6 +906,7 @@ def _prepare_flux(payload: Dict[str, object], *, manual_entry: bool) -> None:
     payload["provenance"] = provenance
 
 
+@lru_cache(maxsize=512)
 def _parse_relative_uncertainty(value: str) -> Optional[float]:
     match = _RELATIVE_UNCERTAINTY_PATTERN.search(value)
     if not match:
@@ -542,14 +937,12 @@ def fetch(
         record, resolution_cm_1, apodization_priority
     )
     page_url = page_href
-    page_html = _download_text(page_url, session=session)
-    jcamp_url = _extract_jcamp_url(page_html, page_url)
-    jcamp_bytes = _download_bytes(jcamp_url, session=session)
+    jcamp_url, jcamp_bytes = _download_spectrum(page_url, session=session)
     payload = parse_jcamp(jcamp_bytes, filename=f"{record.name}.jdx")
     delta_x = _extract_delta_x(jcamp_bytes)
-    manual_entry = key in _MANUAL_SPECIES_LOOKUP
+    manual_entry = _MANUAL_SPECIES_CATALOG.get(key) is record
 
-    metadata = dict(payload.get("metadata") or {})
+    metadata = _owned_dict(payload.get("metadata"))
     metadata.setdefault(
         "source",
         "NIST IR (WebBook)" if manual_entry else "NIST Quantitative IR Database",
@@ -563,17 +956,17 @@ def fetch(
     metadata["catalog_page"] = page_url
     metadata["jcamp_url"] = jcamp_url
     metadata["manual_entry"] = manual_entry
-    if manual_entry:
-        manual_record = _MANUAL_SPECIES_LOOKUP.get(key)
-        if manual_record and manual_record.tokens:
-            metadata["aliases"] = tuple(sorted({alias for alias in manual_record.tokens}))
-        if manual_record and manual_record.sources:
+    manual_record = _MANUAL_SPECIES_LOOKUP.get(key) if manual_entry else None
+    if manual_record is not None:
+        if manual_record.aliases:
+            metadata["aliases"] = manual_record.aliases
+        if manual_record.sources:
             metadata["source_urls"] = tuple(manual_record.sources)
     if delta_x is not None:
         metadata["source_delta_x_cm_1"] = delta_x
     payload["metadata"] = metadata
 
-    provenance = dict(payload.get("provenance") or {})
+    provenance = _owned_dict(payload.get("provenance"))
     provenance["archive"] = "NIST Quantitative IR"
     provenance["relative_uncertainty"] = record.relative_uncertainty
     provenance["apodization"] = measurement.apodization
@@ -581,11 +974,10 @@ def fetch(
     provenance["catalog_page"] = page_url
     provenance["jcamp_url"] = jcamp_url
     provenance["manual_entry"] = manual_entry
-    if manual_entry:
-        manual_record = _MANUAL_SPECIES_LOOKUP.get(key)
-        if manual_record and manual_record.tokens:
-            provenance["aliases"] = tuple(sorted({alias for alias in manual_record.tokens}))
-        if manual_record and manual_record.sources:
+    if manual_record is not None:
+        if manual_record.aliases:
+            provenance["aliases"] = manual_record.aliases
+        if manual_record.sources:
             provenance["source_urls"] = tuple(manual_record.sources)
     if delta_x is not None:
         provenance["source_delta_x_cm_1"] = delta_x
@@ -606,7 +998,38 @@ def fetch(
     _finalise_payload(payload)
 
     return payload
-@dataclass(frozen=True)
+
+
+def fetch_many(
+    species: Sequence[str],
+    *,
+    max_workers: int = 8,
+    session: Optional[requests.Session] = None,
+    **kwargs: object,
+) -> Dict[str, Dict[str, object]]:
+    """Fetch several Quant IR species concurrently, keyed by the requested name.
+
+    Downloads are I/O bound, so a thread pool overlaps the per-species page and
+    JCAMP round trips. Keep ``max_workers`` at or below the pooled adapter's
+    ``pool_maxsize`` so workers do not queue for connections.
+    """
+
+    names = list(dict.fromkeys(name for name in species if name))
+    if not names:
+        return {}
+    if session is None:
+        # Warm the shared catalog once so workers do not race to parse it.
+        _cached_catalog()
+    workers = max(1, min(int(max_workers), len(names)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="quant-ir") as executor:
+        futures = {
+            name: executor.submit(fetch, species=name, session=session, **kwargs)
+            for name in names
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+@dataclass(frozen=True, slots=True)
 class ManualSpeciesRecord:
     name: str
     page_url: str
@@ -614,19 +1037,34 @@ class ManualSpeciesRecord:
     relative_uncertainty: str = "—"
     apodization: str = "Manual (best available)"
     sources: Tuple[str, ...] = ()
-
-    def species(self) -> QuantIRSpecies:
-        return QuantIRSpecies(
-            name=self.name,
-            relative_uncertainty=self.relative_uncertainty,
-            measurements=(
-                QuantIRMeasurement(
-                    apodization=self.apodization,
-                    resolution_links={DEFAULT_RESOLUTION_CM_1: self.page_url},
+    aliases: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    normalised_tokens: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    catalog_species: QuantIRSpecies = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "aliases", tuple(sorted(set(self.tokens))))
+        normalised = (_normalise_token(token) for token in self.all_tokens())
+        object.__setattr__(
+            self, "normalised_tokens", tuple(token for token in normalised if token)
+        )
+        object.__setattr__(
+            self,
+            "catalog_species",
+            QuantIRSpecies(
+                name=self.name,
+                relative_uncertainty=self.relative_uncertainty,
+                measurements=(
+                    QuantIRMeasurement(
+                        apodization=self.apodization,
+                        resolution_links={DEFAULT_RESOLUTION_CM_1: self.page_url},
+                    ),
                 ),
             ),
         )
 
+    def species(self) -> QuantIRSpecies:
+        return self.catalog_species
+
     def all_tokens(self) -> Tuple[str, ...]:
         return (self.name, *self.tokens)
 
@@ -748,14 +1186,18 @@ _MANUAL_SPECIES_RECORDS: Tuple[ManualSpeciesRecord, ...] = (
     ),
 )
 
-_MANUAL_SPECIES_LOOKUP: Dict[str, ManualSpeciesRecord] = {}
-_MANUAL_SPECIES_CATALOG: Dict[str, QuantIRSpecies] = {}
 
-for manual_record in _MANUAL_SPECIES_RECORDS:
-    species = manual_record.species()
-    for token in manual_record.all_tokens():
-        normalised = _normalise_token(token)
-        if not normalised:
-            continue
-        _MANUAL_SPECIES_LOOKUP[normalised] = manual_record
-        _MANUAL_SPECIES_CATALOG[normalised] = species
+def _build_manual_tables(
+    records: Sequence[ManualSpeciesRecord],
+) -> Tuple[Dict[str, ManualSpeciesRecord], Dict[str, QuantIRSpecies]]:
+    lookup: Dict[str, ManualSpeciesRecord] = {}
+    catalog: Dict[str, QuantIRSpecies] = {}
+    for record in records:
+        # One species instance per record, shared by every alias token.
+        for normalised in record.normalised_tokens:
+            lookup[normalised] = record
+            catalog[normalised] = record.catalog_species
+    return lookup, catalog
+
+
+_MANUAL_SPECIES_LOOKUP, _MANUAL_SPECIES_CATALOG = _build_manual_tables(_MANUAL_SPECIES_RECORDS)
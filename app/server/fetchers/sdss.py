@@ -2,18 +2,25 @@ from __future__ import annotations
 
 """Fetch Sloan Digital Sky Survey spectra for curated stellar targets."""
 
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 import hashlib
+import json
+import math
 import unicodedata
 import re
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple
 
 import numpy as np
-from astropy import units as u
 from astropy.io import fits
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from app._version import get_version_info
 from app.utils.flux import flux_percentile_range
@@ -23,6 +30,7 @@ __all__ = ["fetch", "SdssFetchError", "available_targets"]
 
 BASE_URL = "http://data.sdss.org/sas/dr17/sdss/spectro/redux/v5_13_2/spectra/full"
 REQUEST_TIMEOUT = 30  # seconds
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
 ORIGINAL_FLUX_UNIT = "1e-17 erg s^-1 cm^-2 Å^-1"
 ORIGINAL_WAVELENGTH_UNIT = "Å"
 CANONICAL_FLUX_UNIT = "erg s^-1 cm^-2 nm^-1"
@@ -34,16 +42,47 @@ CITATION = (
 )
 DOI = "10.3847/1538-4365/ac4414"
 
+# The source and canonical units are fixed, so the conversions reduce to scalar
+# factors: Å → nm is ×0.1, and 1e-17 erg s⁻¹ cm⁻² Å⁻¹ → erg s⁻¹ cm⁻² nm⁻¹ is
+# ×1e-17 × 10.
+_WAVE_SCALE = 0.1
+_FLUX_SCALE = 1e-16
+_LN10 = math.log(10.0)
+
+
+_TOKEN_RE = re.compile(r"[^a-z0-9]+")
+
 
 class SdssFetchError(RuntimeError):
     """Raised when a SDSS spectrum cannot be retrieved."""
 
 
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared keep-alive pool so consecutive spectra reuse the SAS connection.
+_SESSION = _build_session()
+_HASH_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sdss-hash")
+
+
 def _normalise_token(value: str) -> str:
     normalised = unicodedata.normalize("NFKD", value or "")
     ascii_only = normalised.encode("ascii", "ignore").decode("ascii")
     lowered = ascii_only.lower()
-    return re.sub(r"[^a-z0-9]+", "", lowered)
+    return _TOKEN_RE.sub("", lowered)
 
 
 @dataclass(frozen=True)
@@ -61,6 +100,8 @@ class SdssTarget:
     data_release: str = ARCHIVE_LABEL
     aliases: Tuple[str, ...] = ()
     search_tokens: Tuple[str, ...] = ()
+    filename: str = ""
+    remote_url: str = ""
 
     @property
     def slug(self) -> str:
@@ -71,6 +112,14 @@ class SdssTarget:
         return self.slug
 
 
+def _spec_filename(plate: int, mjd: int, fiber: int) -> str:
+    return f"spec-{plate}-{mjd:05d}-{fiber:04d}.fits"
+
+
+def _remote_url(plate: int, mjd: int, fiber: int) -> str:
+    return f"{BASE_URL}/{plate}/{_spec_filename(plate, mjd, fiber)}"
+
+
 def _create_target(**kwargs: Any) -> SdssTarget:
     aliases = set(kwargs.get("aliases", ()))
     tokens: set[str] = set()
@@ -87,6 +136,9 @@ def _create_target(**kwargs: Any) -> SdssTarget:
     tokens.discard("")
     kwargs["aliases"] = tuple(sorted(aliases))
     kwargs["search_tokens"] = tuple(sorted(tokens))
+    if plate is not None and mjd is not None and fiber is not None:
+        kwargs.setdefault("filename", _spec_filename(plate, mjd, fiber))
+        kwargs.setdefault("remote_url", _remote_url(plate, mjd, fiber))
     return SdssTarget(**kwargs)
 
 
@@ -148,28 +200,54 @@ for entry in _TARGETS:
         if token:
             _TOKEN_LOOKUP.setdefault(token, entry)
 
+_PMF_LOOKUP: Dict[Tuple[int, int, int], SdssTarget] = {
+    (entry.plate, entry.mjd, entry.fiber): entry for entry in _TARGETS
+}
+
+# (token, target position) pairs in token order, so prefix matches are a
+# bisect away instead of a scan over every alias of every target.
+_SORTED_TOKENS: Tuple[Tuple[str, int], ...] = tuple(
+    sorted(
+        (token, position)
+        for position, entry in enumerate(_TARGETS)
+        for token in entry.search_tokens
+    )
+)
+_SORTED_KEYS: Tuple[str, ...] = tuple(token for token, _ in _SORTED_TOKENS)
+_TOKEN_POSITION: Dict[str, int] = {}
+for token, position in _SORTED_TOKENS:
+    _TOKEN_POSITION.setdefault(token, position)
+
+
+def _target_record(entry: SdssTarget) -> Mapping[str, object]:
+    return MappingProxyType(
+        {
+            "canonical_name": entry.canonical_name,
+            "label": entry.label,
+            "plate": entry.plate,
+            "mjd": entry.mjd,
+            "fiber": entry.fiber,
+            "subclass": entry.subclass,
+            "sn_median_r": entry.sn_median_r,
+            "ra_deg": entry.ra_deg,
+            "dec_deg": entry.dec_deg,
+            "instrument": entry.instrument,
+            "data_release": entry.data_release,
+            "aliases": entry.aliases,
+            "search_tokens": entry.search_tokens,
+        }
+    )
 
-def available_targets() -> Tuple[Dict[str, object], ...]:
-    records: List[Dict[str, object]] = []
-    for entry in _TARGETS:
-        records.append(
-            {
-                "canonical_name": entry.canonical_name,
-                "label": entry.label,
-                "plate": entry.plate,
-                "mjd": entry.mjd,
-                "fiber": entry.fiber,
-                "subclass": entry.subclass,
-                "sn_median_r": entry.sn_median_r,
-                "ra_deg": entry.ra_deg,
-                "dec_deg": entry.dec_deg,
-                "instrument": entry.instrument,
-                "data_release": entry.data_release,
-                "aliases": tuple(entry.aliases),
-                "search_tokens": tuple(entry.search_tokens),
-            }
-        )
-    return tuple(records)
+
+# The curated targets are frozen, so their records are built once and shared
+# as read-only views.
+_AVAILABLE_TARGETS: Tuple[Mapping[str, object], ...] = tuple(
+    _target_record(entry) for entry in _TARGETS
+)
+
+
+def available_targets() -> Tuple[Mapping[str, object], ...]:
+    return _AVAILABLE_TARGETS
 
 
 def fetch(
@@ -188,22 +266,31 @@ def fetch(
     cache_directory = _resolve_cache_dir(cache_dir) / entry.cache_key
     cache_directory.mkdir(parents=True, exist_ok=True)
 
-    filename = f"spec-{entry.plate}-{entry.mjd:05d}-{entry.fiber:04d}.fits"
-    local_path = cache_directory / filename
+    local_path = cache_directory / entry.filename
     cache_hit = local_path.exists() and not force_refresh
 
+    remote_url = entry.remote_url
+    sha256_hash: Optional[str] = None
     if not cache_hit:
-        remote_url = _remote_url(entry.plate, entry.mjd, entry.fiber)
-        _download_file(remote_url, local_path)
-    else:
-        remote_url = _remote_url(entry.plate, entry.mjd, entry.fiber)
-
-    spectrum = _parse_sdss_spectrum(local_path)
-    effective_range = flux_percentile_range(
-        spectrum["wavelength_nm"], spectrum["flux"], coverage=0.98
-    )
-
-    sha256_hash = _sha256(local_path)
+        sha256_hash = _download_file(remote_url, local_path, revalidate=force_refresh)
+        # A 304 means the server confirmed the cached file is still current.
+        cache_hit = sha256_hash is None
+        if force_refresh and not cache_hit:
+            # Coarse filesystem timestamps could let a rewritten file keep its
+            # old (mtime, size) key, so drop memoised results explicitly.
+            _parsed_cached.cache_clear()
+            _hashed_cached.cache_clear()
+
+    stat = local_path.stat()
+    cache_key = (str(local_path), stat.st_mtime_ns, stat.st_size)
+    # Fresh downloads were hashed while streaming; cache hits hash the file on
+    # a worker thread while the FITS parse runs here.
+    pending_hash = None
+    if sha256_hash is None:
+        pending_hash = _HASH_EXECUTOR.submit(_hashed_cached, *cache_key)
+    parsed = _parsed_cached(*cache_key)
+    if pending_hash is not None:
+        sha256_hash = pending_hash.result()
     fetch_time = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
     version_info = get_version_info().get("version", "unknown")
 
@@ -236,25 +323,22 @@ def fetch(
             "wavelength": CANONICAL_WAVELENGTH_UNIT,
             "flux": CANONICAL_FLUX_UNIT,
         },
-        "wavelength_min_nm": float(np.nanmin(spectrum["wavelength_nm"])),
-        "wavelength_max_nm": float(np.nanmax(spectrum["wavelength_nm"])),
-        "wavelength_sample_count": int(spectrum["wavelength_nm"].size),
+        "wavelength_min_nm": parsed.wavelength_bounds[0],
+        "wavelength_max_nm": parsed.wavelength_bounds[1],
+        "wavelength_sample_count": int(parsed.wavelength_nm.size),
     }
 
-    if effective_range is not None:
-        meta["wavelength_effective_range_nm"] = [
-            float(effective_range[0]),
-            float(effective_range[1]),
-        ]
+    if parsed.effective_range is not None:
+        meta["wavelength_effective_range_nm"] = list(parsed.effective_range)
 
     payload: Dict[str, Any] = {
-        "wavelength_nm": spectrum["wavelength_nm"].tolist(),
-        "intensity": spectrum["flux"].tolist(),
+        "wavelength_nm": parsed.wavelength_nm.tolist(),
+        "intensity": parsed.flux.tolist(),
         "meta": meta,
     }
 
-    if spectrum["uncertainty"] is not None:
-        payload["uncertainty_stat"] = spectrum["uncertainty"].tolist()
+    if parsed.uncertainty is not None:
+        payload["uncertainty_stat"] = parsed.uncertainty.tolist()
 
     return payload
 
@@ -267,21 +351,18 @@ def _resolve_target(
     fiber: int | None = None,
 ) -> SdssTarget:
     if plate is not None and mjd is not None and fiber is not None:
-        for entry in _TARGETS:
-            if entry.plate == int(plate) and entry.mjd == int(mjd) and entry.fiber == int(fiber):
-                return entry
+        entry = _PMF_LOOKUP.get((int(plate), int(mjd), int(fiber)))
+        if entry is not None:
+            return entry
     if target:
         token = _normalise_token(target)
         entry = _TOKEN_LOOKUP.get(token)
         if entry is not None:
             return entry
-    if target:
         # Try matching by partial token
-        token = _normalise_token(target)
-        for entry in _TARGETS:
-            for alias in entry.search_tokens:
-                if alias.startswith(token) or token.startswith(alias):
-                    return entry
+        entry = _prefix_match(token)
+        if entry is not None:
+            return entry
     known = ", ".join(entry.slug for entry in _TARGETS)
     raise SdssFetchError(
         "Unknown SDSS target. Provide plate, mjd, fiber or known name. "
@@ -289,8 +370,23 @@ def _resolve_target(
     )
 
 
-def _remote_url(plate: int, mjd: int, fiber: int) -> str:
-    return f"{BASE_URL}/{plate}/spec-{plate}-{mjd:05d}-{fiber:04d}.fits"
+def _prefix_match(token: str) -> Optional[SdssTarget]:
+    """Return the earliest target with an alias that extends or prefixes ``token``."""
+
+    positions = []
+    # Aliases that start with the token sit contiguously from its insertion point.
+    index = bisect_left(_SORTED_KEYS, token)
+    while index < len(_SORTED_KEYS) and _SORTED_KEYS[index].startswith(token):
+        positions.append(_SORTED_TOKENS[index][1])
+        index += 1
+    # Aliases that the token starts with are exact hits on one of its prefixes.
+    for length in range(1, len(token)):
+        position = _TOKEN_POSITION.get(token[:length])
+        if position is not None:
+            positions.append(position)
+    if not positions:
+        return None
+    return _TARGETS[min(positions)]
 
 
 def _resolve_cache_dir(cache_dir: str | Path | None) -> Path:
@@ -300,20 +396,76 @@ def _resolve_cache_dir(cache_dir: str | Path | None) -> Path:
     return root / "data" / "providers" / "sdss"
 
 
-def _download_file(url: str, destination: Path) -> None:
+def _validators_path(destination: Path) -> Path:
+    return destination.with_name(destination.name + ".validators.json")
+
+
+def _read_validators(destination: Path) -> Dict[str, str]:
+    try:
+        document = json.loads(_validators_path(destination).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(document, dict):
+        return {}
+    headers: Dict[str, str] = {}
+    if document.get("etag"):
+        headers["If-None-Match"] = str(document["etag"])
+    if document.get("last_modified"):
+        headers["If-Modified-Since"] = str(document["last_modified"])
+    return headers
+
+
+def _write_validators(
+    destination: Path, *, etag: Optional[str], last_modified: Optional[str]
+) -> None:
+    path = _validators_path(destination)
+    try:
+        if etag or last_modified:
+            document = {"etag": etag, "last_modified": last_modified}
+            path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        else:
+            path.unlink(missing_ok=True)
+    except OSError:  # pragma: no cover - validators are best effort
+        pass
+
+
+def _download_file(
+    url: str, destination: Path, *, revalidate: bool = False
+) -> Optional[str]:
+    """Stream ``url`` to ``destination`` and return the SHA-256 of the body.
+
+    With ``revalidate`` the stored ETag/Last-Modified validators are sent, and
+    ``None`` is returned when the server confirms the local copy is current.
+    """
+
     destination.parent.mkdir(parents=True, exist_ok=True)
-    with requests.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+    headers = _read_validators(destination) if revalidate and destination.exists() else {}
+    digest = hashlib.sha256()
+    with _SESSION.get(
+        url, stream=True, timeout=REQUEST_TIMEOUT, headers=headers or None
+    ) as response:
+        if response.status_code == 304 and headers:
+            return None
         if response.status_code == 404:
             raise SdssFetchError(f"SDSS spectrum not found at {url}")
         response.raise_for_status()
         with destination.open("wb") as handle:
-            for chunk in response.iter_content(chunk_size=65536):
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                 if chunk:
+                    digest.update(chunk)
                     handle.write(chunk)
+        _write_validators(
+            destination,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+    return digest.hexdigest()
 
 
 def _parse_sdss_spectrum(path: Path) -> Dict[str, np.ndarray]:
-    with fits.open(path) as hdul:
+    # Memory-map the file so only the pages behind the three columns we read
+    # are touched; SDSS tables also carry mask, model, sky and wdisp columns.
+    with fits.open(path, memmap=True, lazy_load_hdus=True) as hdul:
         if len(hdul) < 2:
             raise SdssFetchError(
                 f"SDSS file {path} is missing the primary spectral extension."
@@ -323,35 +475,82 @@ def _parse_sdss_spectrum(path: Path) -> Dict[str, np.ndarray]:
             raise SdssFetchError(
                 f"SDSS file {path} does not contain a spectral table."
             )
+        names = table.names
         try:
-            loglam = np.asarray(table["loglam"], dtype=float)
-            flux = np.asarray(table["flux"], dtype=float)
+            # np.array copies out of the mapping so the file can close cleanly.
+            loglam = np.array(table["loglam"], dtype=np.float64)
+            flux = np.array(table["flux"], dtype=np.float64)
         except (KeyError, TypeError) as exc:  # pragma: no cover - defensive
             raise SdssFetchError("SDSS spectral table lacks loglam/flux columns") from exc
+        ivar = np.array(table["ivar"], dtype=np.float64) if "ivar" in names else None
+        del table
+
+    # 10**loglam as exp(loglam·ln10), evaluated in one output buffer.
+    wavelength_nm = np.multiply(loglam, _LN10)
+    np.exp(wavelength_nm, out=wavelength_nm)
+    wavelength_nm *= _WAVE_SCALE
+    flux *= _FLUX_SCALE
+
+    uncertainty: Optional[np.ndarray] = None
+    if ivar is not None:
+        # sigma = 1/sqrt(ivar), evaluated in place on the private ivar copy;
+        # non-positive inverse variances carry no error estimate.
+        valid = ivar > 0.0
+        np.sqrt(ivar, out=ivar, where=valid)
+        np.reciprocal(ivar, out=ivar, where=valid)
+        ivar *= _FLUX_SCALE
+        ivar[~valid] = np.nan
+        uncertainty = ivar
+
+    return {
+        "wavelength_nm": wavelength_nm,
+        "flux": flux,
+        "uncertainty": uncertainty,
+    }
+
+
+class _ParsedSpectrum(NamedTuple):
+    """Read-only arrays and derived summaries for one on-disk spectrum."""
+
+    wavelength_nm: np.ndarray
+    flux: np.ndarray
+    uncertainty: Optional[np.ndarray]
+    effective_range: Optional[Tuple[float, float]]
+    wavelength_bounds: Tuple[float, float]
+
+
+@lru_cache(maxsize=32)
+def _parsed_cached(path: str, mtime_ns: int, size: int) -> _ParsedSpectrum:
+    """Parse ``path`` once per on-disk revision, identified by mtime and size."""
+
+    spectrum = _parse_sdss_spectrum(Path(path))
+    wavelength_nm = spectrum["wavelength_nm"]
+    # The percentile window sorts both arrays, so it is memoised with the parse
+    # rather than recomputed on every cache hit; likewise the grid bounds.
+    effective_range = flux_percentile_range(
+        wavelength_nm, spectrum["flux"], coverage=0.98
+    )
+    if effective_range is not None:
+        effective_range = (float(effective_range[0]), float(effective_range[1]))
+    bounds = (float(np.nanmin(wavelength_nm)), float(np.nanmax(wavelength_nm)))
+    arrays = (wavelength_nm, spectrum["flux"], spectrum["uncertainty"])
+    for array in arrays:
+        if array is not None:
+            array.flags.writeable = False
+    return _ParsedSpectrum(*arrays, effective_range, bounds)
+
+
+@lru_cache(maxsize=32)
+def _hashed_cached(path: str, mtime_ns: int, size: int) -> str:
+    return _sha256(Path(path))
+
 
-        wavelength = np.power(10.0, loglam) * u.AA
-        flux_raw = flux * (1e-17 * u.erg / (u.s * u.cm**2 * u.AA))
-        wavelength_nm = wavelength.to(u.nm).value
-        flux_converted = flux_raw.to(u.erg / (u.s * u.cm**2 * u.nm)).value
-
-        uncertainty: Optional[np.ndarray] = None
-        if "ivar" in table.names:
-            ivar = np.asarray(table["ivar"], dtype=float)
-            with np.errstate(divide="ignore", invalid="ignore"):
-                sigma = np.sqrt(np.where(ivar > 0.0, 1.0 / ivar, np.nan))
-            sigma_quantity = sigma * (1e-17 * u.erg / (u.s * u.cm**2 * u.AA))
-            uncertainty = sigma_quantity.to(u.erg / (u.s * u.cm**2 * u.nm)).value
-
-        return {
-            "wavelength_nm": wavelength_nm.astype(float),
-            "flux": flux_converted.astype(float),
-            "uncertainty": None if uncertainty is None else uncertainty.astype(float),
-        }
 def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            if not block:
-                break
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: hashes from the raw file descriptor in OpenSSL.
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for block in iter(lambda: handle.read(_DOWNLOAD_CHUNK_SIZE), b""):
             digest.update(block)
     return digest.hexdigest()
@@ -4,14 +4,16 @@ import hashlib
 import io
 import math
 import re
-from array import array
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 from astropy import units as u
 
-from app.utils.downsample import build_downsample_tiers
+from app.utils.downsample import DownsampleResult, build_downsample_tiers
 from .units import to_nm
 
 
@@ -93,148 +95,198 @@ HEADER_ALIAS_MAP = {
 
 UNIT_PATTERN = re.compile(r"\(([^)]+)\)|\[([^\]]+)\]")
 RANGE_NUMERIC = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+# Separator runs for header keys and label tokens (inputs are lower-cased).
+# ASCII text takes the equivalent ``str.translate`` tables instead.
+_NON_ALNUM_RUN = re.compile(r"[^a-z0-9]+")
+_ASCII_NON_ALNUM = [
+    char for char in map(chr, range(128)) if not ("a" <= char <= "z" or "0" <= char <= "9")
+]
+_HEADER_KEY_TABLE = str.maketrans(dict.fromkeys(_ASCII_NON_ALNUM, "_"))
+_LABEL_TOKEN_TABLE = str.maketrans(dict.fromkeys(_ASCII_NON_ALNUM, " "))
+_UNIT_LABEL_SPLIT = re.compile(r"[\s_\-\/]+")
+
+
+_FLUX_LABEL_KEYWORDS = frozenset(
+    {
+        "flux",
+        "intensity",
+        "power",
+        "counts",
+        "brightness",
+        "continuum",
+        "spectral",
+        "density",
+        "irradiance",
+        "radiance",
+        "luminosity",
+        "luminance",
+        "emission",
+        "emittance",
+        "fnu",
+        "flam",
+        "surface",
+        "fluxdensity",
+        "spectralflux",
+    }
+)
 
+_FLUX_LABEL_SUBSTRINGS = frozenset(
+    {
+        "flux",
+        "intens",
+        "brightness",
+        "continuum",
+        "spectral",
+        "density",
+        "irradiance",
+        "radiance",
+        "luminos",
+        "lumin",
+        "emission",
+        "fnu",
+        "flam",
+        "count",
+        "fluxdens",
+    }
+)
+
+_FLUX_UNIT_KEYWORDS = frozenset(
+    {
+        "erg",
+        "ergs",
+        "jansky",
+        "jy",
+        "w/",
+        "w m",
+        "watt",
+        "photon",
+        "photons",
+        "count",
+        "counts",
+        "adu",
+        "flux",
+        "intens",
+        "radiance",
+        "irradiance",
+        "nm^-1",
+        "hz^-1",
+        "cm^-2",
+        "sr^-1",
+        "/nm",
+    }
+)
+
+_NON_FLUX_LABEL_KEYWORDS = frozenset(
+    {
+        "airmass",
+        "air",
+        "altitude",
+        "azimuth",
+        "date",
+        "time",
+        "sun",
+        "moon",
+        "earth",
+        "target",
+        "object",
+        "quality",
+        "flag",
+        "mask",
+        "error",
+        "uncertainty",
+        "sigma",
+        "std",
+        "stdev",
+        "velocity",
+        "speed",
+        "km",
+        "kms",
+        "temperature",
+        "temp",
+        "exposure",
+        "seeing",
+        "angle",
+        "index",
+        "ratio",
+    }
+)
 
-_FLUX_LABEL_KEYWORDS = {
-    "flux",
-    "intensity",
-    "power",
-    "counts",
-    "brightness",
-    "continuum",
-    "spectral",
-    "density",
-    "irradiance",
-    "radiance",
-    "luminosity",
-    "luminance",
-    "emission",
-    "emittance",
-    "fnu",
-    "flam",
-    "surface",
-    "fluxdensity",
-    "spectralflux",
-}
 
-_FLUX_LABEL_SUBSTRINGS = {
-    "flux",
-    "intens",
-    "brightness",
-    "continuum",
-    "spectral",
-    "density",
-    "irradiance",
-    "radiance",
-    "luminos",
-    "lumin",
-    "emission",
-    "fnu",
-    "flam",
-    "count",
-    "fluxdens",
-}
+def _minimal_substrings(keywords: Iterable[str]) -> Tuple[str, ...]:
+    # A keyword that contains another keyword can never be the only match,
+    # so substring scans only need the shortest members.
+    ordered = sorted(set(keywords), key=lambda item: (len(item), item))
+    kept: List[str] = []
+    for keyword in ordered:
+        if not any(shorter in keyword for shorter in kept):
+            kept.append(keyword)
+    return tuple(kept)
 
-_FLUX_UNIT_KEYWORDS = {
-    "erg",
-    "ergs",
-    "jansky",
-    "jy",
-    "w/",
-    "w m",
-    "watt",
-    "photon",
-    "photons",
-    "count",
-    "counts",
-    "adu",
-    "flux",
-    "intens",
-    "radiance",
-    "irradiance",
-    "nm^-1",
-    "hz^-1",
-    "cm^-2",
-    "sr^-1",
-    "/nm",
-}
 
-_NON_FLUX_LABEL_KEYWORDS = {
-    "airmass",
-    "air",
-    "altitude",
-    "azimuth",
-    "date",
-    "time",
-    "sun",
-    "moon",
-    "earth",
-    "target",
-    "object",
-    "quality",
-    "flag",
-    "mask",
-    "error",
-    "uncertainty",
-    "sigma",
-    "std",
-    "stdev",
-    "velocity",
-    "speed",
-    "km",
-    "kms",
-    "temperature",
-    "temp",
-    "exposure",
-    "seeing",
-    "angle",
-    "index",
-    "ratio",
-}
+_RELATIVE_FLUX_UNIT_TOKENS = frozenset(
+    {"arb", "arbitrary", "adu", "counts", "count", "relative", "norm"}
+)
 
+_FLUX_LABEL_SUBSTRING_SCAN = _minimal_substrings(_FLUX_LABEL_SUBSTRINGS)
+_FLUX_UNIT_SUBSTRING_SCAN = _minimal_substrings(_FLUX_UNIT_KEYWORDS)
+_RELATIVE_FLUX_UNIT_SCAN = _minimal_substrings(_RELATIVE_FLUX_UNIT_TOKENS)
 
-def checksum_bytes(content: bytes) -> str:
-    """Return a stable SHA-256 digest for the provided payload."""
 
-    return hashlib.sha256(content).hexdigest()
+def checksum_bytes(content: bytes | bytearray | memoryview) -> str:
+    """Return a stable SHA-256 digest for the provided payload.
 
+    Any bytes-like object is hashed through the buffer protocol, so callers
+    holding a ``memoryview`` slice never need to materialise a ``bytes`` copy.
+    The digest is a content fingerprint, not a security boundary, so the
+    hash is requested with ``usedforsecurity=False`` to stay on OpenSSL's
+    fast path on FIPS-configured builds.
+    """
 
-def _parse_numeric_token(token: str) -> Optional[float]:
-    cleaned = token.strip()
-    if not cleaned:
-        return None
-    cleaned = cleaned.replace("D", "E").replace("d", "E")
-    try:
-        return float(cleaned)
-    except ValueError:
-        return None
+    return hashlib.sha256(memoryview(content), usedforsecurity=False).hexdigest()
 
 
+@lru_cache(maxsize=1024)
 def _normalise_header_key(key: str) -> str:
-    cleaned = key.strip().lower().replace("μ", "µ")
-    cleaned = re.sub(r"[^a-z0-9]+", "_", cleaned)
-    cleaned = re.sub(r"_+", "_", cleaned)
-    return cleaned.strip("_")
+    cleaned = key.strip().lower()
+    if cleaned.isascii():
+        cleaned = cleaned.translate(_HEADER_KEY_TABLE)
+    else:
+        cleaned = _NON_ALNUM_RUN.sub("_", cleaned)
+    return "_".join(filter(None, cleaned.split("_")))
 
 
 def _is_flux_like_label(label: str) -> bool:
-    lowered = str(label).strip().lower()
+    return _is_flux_like_text(str(label))
+
+
+@lru_cache(maxsize=2048)
+def _is_flux_like_text(label: str) -> bool:
+    # Column labels repeat across header scans, column detection and the
+    # additional-trace loop, so the verdict is memoised per label.
+    lowered = label.strip().lower()
     if not lowered:
         return False
-    tokens = [token for token in re.split(r"[^a-z0-9]+", lowered) if token]
+    if lowered.isascii():
+        tokens = lowered.translate(_LABEL_TOKEN_TABLE).split()
+    else:
+        tokens = [token for token in _NON_ALNUM_RUN.split(lowered) if token]
     significant = [token for token in tokens if len(token) > 1]
     if significant and all(token in _NON_FLUX_LABEL_KEYWORDS for token in significant):
         return False
-    for token in tokens:
-        if token in _FLUX_LABEL_KEYWORDS:
-            return True
-        if any(keyword in token for keyword in _FLUX_LABEL_SUBSTRINGS):
+    if not _FLUX_LABEL_KEYWORDS.isdisjoint(tokens):
+        return True
+    # Tokens are alphanumeric runs and no keyword spans a separator, so one
+    # pass per keyword over the joined tokens replaces the per-token scan.
+    joined = " ".join(tokens)
+    for keyword in _FLUX_LABEL_SUBSTRING_SCAN:
+        if keyword in joined:
             return True
-    unit_hint = _extract_flux_unit_from_label(str(label))
+    unit_hint = _extract_flux_unit_from_label(label)
     if unit_hint:
         lowered_unit = unit_hint.strip().lower()
-        if any(keyword in lowered_unit for keyword in _FLUX_UNIT_KEYWORDS):
-            return True
+        for keyword in _FLUX_UNIT_SUBSTRING_SCAN:
+            if keyword in lowered_unit:
+                return True
     return False
 
 
@@ -245,9 +297,11 @@ def _split_header_line(line: str) -> Optional[Tuple[str, str]]:
     stripped = stripped.lstrip("#").strip()
     if not stripped:
         return None
+    # Separators are tried in priority order, not by position ("Time = 10:30"
+    # splits on ":"); ``partition`` finds and splits in a single scan.
     for sep in (":", "=", "\t"):
-        if sep in stripped:
-            key, value = stripped.split(sep, 1)
+        key, found, value = stripped.partition(sep)
+        if found:
             return key.strip(), value.strip()
     parts = stripped.split(None, 1)
     if len(parts) == 2:
@@ -255,32 +309,56 @@ def _split_header_line(line: str) -> Optional[Tuple[str, str]]:
     return None
 
 
+_ANGSTROM_UNIT_LABELS = frozenset({"å", "a", "ångström", "ångstrom"})
+_NANOMETRE_UNIT_LABELS = frozenset({"nm", "nanometer", "nanometers"})
+_MICRON_UNIT_LABELS = frozenset({"um", "µm", "micron", "microns", "micrometer", "micrometers"})
+_WAVENUMBER_UNIT_LABELS = frozenset({"cm^-1", "cm-1"})
+# Plain unit tokens resolve directly; anything else goes through the
+# candidate scan in ``_extract_unit_hint``.
+_DIRECT_UNIT_HINTS: Dict[str, str] = {
+    **dict.fromkeys(_ANGSTROM_UNIT_LABELS | {"angstrom", "angstroms"}, "Å"),
+    **dict.fromkeys(_NANOMETRE_UNIT_LABELS, "nm"),
+    **dict.fromkeys(_MICRON_UNIT_LABELS, "µm"),
+    **dict.fromkeys(_WAVENUMBER_UNIT_LABELS, "cm^-1"),
+}
+
+
 def _extract_unit_hint(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
-    lowered = str(text).strip()
+    return _unit_hint_for(str(text))
+
+
+@lru_cache(maxsize=1024)
+def _unit_hint_for(text: str) -> Optional[str]:
+    # Header values and column labels repeat across lines, segments and
+    # extra traces; the candidate scan below only runs once per label.
+    lowered = text.strip()
     if not lowered:
         return None
     lowered = lowered.replace("μ", "µ")
+    direct = _DIRECT_UNIT_HINTS.get(lowered.lower())
+    if direct is not None:
+        return direct
     candidates: List[str] = []
     for match in UNIT_PATTERN.findall(lowered):
         candidates.extend(filter(None, match))
     candidates.append(lowered)
-    pieces = re.split(r"[\s_\-\/]+", lowered)
+    pieces = _UNIT_LABEL_SPLIT.split(lowered)
     candidates.extend(pieces)
     for candidate in candidates:
         norm = candidate.strip().lower()
         if not norm:
             continue
-        if "angstrom" in norm or norm in {"å", "a", "ångström", "ångstrom"}:
+        if "angstrom" in norm or norm in _ANGSTROM_UNIT_LABELS:
             return "Å"
-        if norm in {"nm", "nanometer", "nanometers"}:
+        if norm in _NANOMETRE_UNIT_LABELS:
             return "nm"
-        if norm in {"um", "µm", "micron", "microns", "micrometer", "micrometers"}:
+        if norm in _MICRON_UNIT_LABELS:
             return "µm"
         if "cm" in norm and "-1" in norm:
             return "cm^-1"
-        if norm in {"cm^-1", "cm-1"}:
+        if norm in _WAVENUMBER_UNIT_LABELS:
             return "cm^-1"
         if "wavenumber" in norm:
             return "cm^-1"
@@ -288,10 +366,13 @@ def _extract_unit_hint(text: Optional[str]) -> Optional[str]:
 
 
 def _parse_range_value(value: str, default_unit: str) -> Optional[Tuple[float, float]]:
-    numbers = [float(part) for part in RANGE_NUMERIC.findall(value)]
-    if len(numbers) < 2:
+    # Only the first two numbers matter; stop scanning once both are found.
+    matches = RANGE_NUMERIC.finditer(value)
+    first = next(matches, None)
+    second = next(matches, None)
+    if second is None:
         return None
-    low, high = numbers[0], numbers[1]
+    low, high = float(first.group()), float(second.group())
     if math.isclose(low, high):
         return None
     unit = _extract_unit_hint(value) or default_unit
@@ -304,15 +385,77 @@ def _parse_range_value(value: str, default_unit: str) -> Optional[Tuple[float, f
     if not math.isfinite(low_nm) or not math.isfinite(high_nm):
         return None
     return low_nm, high_nm
+
+
+_HeaderHints = Dict[str, Optional[str]]
+_AliasHandler = Callable[[Dict[str, object], _HeaderHints, List[str], str, str], None]
+
+
+def _set_alias(
+    metadata: Dict[str, object], hints: _HeaderHints, labels: List[str], alias: str, value: str
+) -> None:
+    metadata.setdefault(alias, value)
+
+
+def _set_label_alias(
+    metadata: Dict[str, object], hints: _HeaderHints, labels: List[str], alias: str, value: str
+) -> None:
+    metadata.setdefault(alias, value)
+    labels.append(value)
+
+
+def _set_flux_unit(
+    metadata: Dict[str, object], hints: _HeaderHints, labels: List[str], alias: str, value: str
+) -> None:
+    metadata.setdefault("flux_unit", value)
+    metadata.setdefault("reported_flux_unit", value)
+    hints["flux_unit"] = hints["flux_unit"] or value
+
+
+def _set_wavelength_unit(
+    metadata: Dict[str, object], hints: _HeaderHints, labels: List[str], alias: str, value: str
+) -> None:
+    metadata.setdefault("reported_wavelength_unit", value)
+    hints["wavelength_unit"] = hints["wavelength_unit"] or _extract_unit_hint(value)
+
+
+def _set_axis(
+    metadata: Dict[str, object], hints: _HeaderHints, labels: List[str], alias: str, value: str
+) -> None:
+    metadata.setdefault("axis", value)
+    hints["axis"] = hints["axis"] or value
+
+
+def _set_wavelength_range(
+    metadata: Dict[str, object], hints: _HeaderHints, labels: List[str], alias: str, value: str
+) -> None:
+    parsed = _parse_range_value(value, "nm")
+    if parsed:
+        metadata.setdefault("wavelength_effective_range_nm", list(parsed))
+
+
+# Aliases without an entry here (instrument, telescope, observation_date, ...)
+# are stored verbatim under their alias by ``_set_alias``.
+_ALIAS_HANDLERS: Dict[str, _AliasHandler] = {
+    "target": _set_label_alias,
+    "source": _set_label_alias,
+    "title": _set_label_alias,
+    "flux_unit": _set_flux_unit,
+    "wavelength_unit": _set_wavelength_unit,
+    "axis": _set_axis,
+    "wavelength_range": _set_wavelength_range,
+}
+
+
 def _collect_header_metadata(
     header_lines: Sequence[str],
 ) -> Tuple[Dict[str, object], Dict[str, str], List[str], Optional[str], Optional[str], Optional[str]]:
     metadata: Dict[str, object] = {}
     raw: Dict[str, str] = {}
     label_candidates: List[str] = []
-    axis_hint: Optional[str] = None
-    wavelength_unit_hint: Optional[str] = None
-    flux_unit_hint: Optional[str] = None
+    hints: _HeaderHints = {"axis": None, "wavelength_unit": None, "flux_unit": None}
+    alias_for = HEADER_ALIAS_MAP.get
+    handler_for = _ALIAS_HANDLERS.get
 
     for line in header_lines:
         pair = _split_header_line(line)
@@ -324,44 +467,27 @@ def _collect_header_metadata(
         if not norm_key:
             continue
         raw[norm_key] = value
-        alias = HEADER_ALIAS_MAP.get(norm_key, norm_key)
-        if alias == "instrument":
-            metadata.setdefault("instrument", value)
-        elif alias == "telescope":
-            metadata.setdefault("telescope", value)
-        elif alias == "target":
-            metadata.setdefault("target", value)
-            label_candidates.append(value)
-        elif alias == "source":
-            metadata.setdefault("source", value)
-            label_candidates.append(value)
-        elif alias == "title":
-            metadata.setdefault("title", value)
-            label_candidates.append(value)
-        elif alias == "observation_date":
-            metadata.setdefault("observation_date", value)
-        elif alias == "flux_unit":
-            metadata.setdefault("flux_unit", value)
-            metadata.setdefault("reported_flux_unit", value)
-            flux_unit_hint = flux_unit_hint or value
-        elif alias == "wavelength_unit":
-            metadata.setdefault("reported_wavelength_unit", value)
-            wavelength_unit_hint = wavelength_unit_hint or _extract_unit_hint(value)
-        elif alias == "axis":
-            metadata.setdefault("axis", value)
-            axis_hint = axis_hint or value
-        elif alias == "wavelength_range":
-            parsed = _parse_range_value(value, "nm")
-            if parsed:
-                metadata.setdefault("wavelength_effective_range_nm", list(parsed))
-        elif alias == "wavelength_start":
-            metadata.setdefault("wavelength_start", value)
-        elif alias == "wavelength_end":
-            metadata.setdefault("wavelength_end", value)
-        else:
-            metadata.setdefault(alias, value)
+        alias = alias_for(norm_key, norm_key)
+        handler_for(alias, _set_alias)(metadata, hints, label_candidates, alias, value)
+
+    return (
+        metadata,
+        raw,
+        label_candidates,
+        hints["axis"],
+        hints["wavelength_unit"],
+        hints["flux_unit"],
+    )
+
 
-    return metadata, raw, label_candidates, axis_hint, wavelength_unit_hint, flux_unit_hint
+def _downsample_payload(tiers: Mapping[int, DownsampleResult]) -> Dict[int, Dict[str, object]]:
+    # Tier samples are already immutable float tuples; handing them over
+    # as-is avoids a list copy per tier and per trace, and consumers only
+    # iterate, measure or ``np.asarray`` them.
+    return {
+        int(level): {"wavelength_nm": result.wavelength_nm, "flux": result.flux}
+        for level, result in tiers.items()
+    }
 
 
 def _series_summary(sample_count: int, metadata: Mapping[str, object], flux_unit: str) -> str:
@@ -389,51 +515,60 @@ def _series_summary(sample_count: int, metadata: Mapping[str, object], flux_unit
     return " • ".join(parts)
 
 
+_WAVELENGTH_COLUMN_KEYWORDS = ("wave", "lam", "freq", "wn")
+
+# Prefer flux-like columns (including irradiance/radiance style labels) and
+# use an explicit unit label as a tie-breaker when multiple candidates are present.
+# The keyword list intentionally mirrors the heuristics in ``_is_flux_like_label``
+# so that "spectral power", "spectral irradiance", and similar phrases outrank
+# contextual columns such as "Sun" or "Observer" that may appear alongside them.
+_FLUX_COLUMN_KEYWORDS = (
+    "flux",
+    "int",
+    "power",
+    "counts",
+    "brightness",
+    "irradiance",
+    "radiance",
+    "spectral power",
+    "spectral irradiance",
+    "spectral radiance",
+    "power density",
+)
+_SPECTRAL_COLUMN_TOKENS = frozenset({"power", "flux", "irradiance", "radiance"})
+
+
 def _detect_columns(df: pd.DataFrame) -> Tuple[str, str]:
-    columns = list(df.columns)
+    columns = tuple(df.columns)
     if len(columns) < 2:
         raise ValueError("Missing wavelength or flux column in ASCII data")
+    return _detect_column_labels(columns)
+
+
+@lru_cache(maxsize=128)
+def _detect_column_labels(columns: Tuple[object, ...]) -> Tuple[str, str]:
+    # Uploads from the same instrument repeat the same header, so the scoring
+    # below runs once per distinct schema.
+    lowered_labels = [str(name).lower() for name in columns]
 
     wavelength = columns[0]
     flux = columns[1]
-    for name in columns:
-        label = str(name).lower()
-        if any(keyword in label for keyword in ("wave", "lam", "freq", "wn")):
+    for name, lowered in zip(columns, lowered_labels):
+        if any(keyword in lowered for keyword in _WAVELENGTH_COLUMN_KEYWORDS):
             wavelength = name
             break
 
-    # Prefer flux-like columns (including irradiance/radiance style labels) and
-    # use an explicit unit label as a tie-breaker when multiple candidates are present.
-    # The keyword list intentionally mirrors the heuristics in ``_is_flux_like_label``
-    # so that "spectral power", "spectral irradiance", and similar phrases outrank
-    # contextual columns such as "Sun" or "Observer" that may appear alongside them.
-    flux_keywords = (
-        "flux",
-        "int",
-        "power",
-        "counts",
-        "brightness",
-        "irradiance",
-        "radiance",
-        "spectral power",
-        "spectral irradiance",
-        "spectral radiance",
-        "power density",
-    )
-    spectral_tokens = {"power", "flux", "irradiance", "radiance"}
     best_score: Tuple[int, int, int, int] | None = None
     best_flux = flux
-    for idx, name in enumerate(columns):
+    for idx, (name, lowered) in enumerate(zip(columns, lowered_labels)):
         if name == wavelength:
             continue
 
         label = str(name)
-        lowered = label.lower()
-        tokens = [token for token in re.split(r"[^a-z0-9]+", lowered) if token]
-        token_set = set(tokens)
-        keyword_match = any(keyword in lowered for keyword in flux_keywords)
+        token_set = {token for token in _NON_ALNUM_RUN.split(lowered) if token}
+        keyword_match = any(keyword in lowered for keyword in _FLUX_COLUMN_KEYWORDS)
         if not keyword_match and "spectral" in token_set:
-            keyword_match = bool(spectral_tokens & token_set)
+            keyword_match = bool(_SPECTRAL_COLUMN_TOKENS & token_set)
         unit_match = 1 if _extract_flux_unit_from_label(label) else 0
         score = (
             1 if _is_flux_like_label(label) else 0,
@@ -463,6 +598,7 @@ def _extract_flux_unit_from_label(label: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=1024)
 def _normalise_flux_unit(unit: Optional[str]) -> Tuple[str, str]:
     if not unit:
         return "arb", "relative"
@@ -470,52 +606,9 @@ def _normalise_flux_unit(unit: Optional[str]) -> Tuple[str, str]:
     if not cleaned:
         return "arb", "relative"
     lowered = cleaned.lower()
-    relative_tokens = {"arb", "arbitrary", "adu", "counts", "count", "relative", "norm"}
-    if any(token in lowered for token in relative_tokens):
-        return cleaned, "relative"
-    return cleaned, "absolute"
-
-
-def _normalise_axis(value: Optional[str]) -> Optional[str]:
-    if not value:
-        return None
-    lowered = value.strip().lower()
-    if not lowered:
-        return None
-    if "abs" in lowered:
-        return "absorption"
-    if "trans" in lowered:
-        return "transmission"
-    if "reflec" in lowered:
-        return "reflection"
-    if "emiss" in lowered:
-        return "emission"
-    return value.strip()
-
-
-
-
-def _extract_flux_unit_from_label(label: str) -> Optional[str]:
-    matches = UNIT_PATTERN.findall(label)
-    for match in matches:
-        candidate = next((part for part in match if part), None)
-        if candidate:
-            cleaned = candidate.strip()
-            if cleaned:
-                return cleaned
-    return None
-
-
-def _normalise_flux_unit(unit: Optional[str]) -> Tuple[str, str]:
-    if not unit:
-        return "arb", "relative"
-    cleaned = unit.strip()
-    if not cleaned:
-        return "arb", "relative"
-    lowered = cleaned.lower()
-    relative_tokens = {"arb", "arbitrary", "adu", "counts", "count", "relative", "norm"}
-    if any(token in lowered for token in relative_tokens):
-        return cleaned, "relative"
+    for token in _RELATIVE_FLUX_UNIT_SCAN:
+        if token in lowered:
+            return cleaned, "relative"
     return cleaned, "absolute"
 
 
@@ -577,12 +670,12 @@ def parse_ascii(
     metadata.setdefault("wavelength_column", str(wavelength_col))
     metadata.setdefault("flux_column", str(flux_col))
 
-    numeric = dataframe.copy()
-    for column in numeric.columns:
-        numeric[column] = pd.to_numeric(numeric[column], errors="coerce")
-
-    working = numeric[[wavelength_col, flux_col]].dropna()
-    if working.empty:
+    # Only the two spectral columns are needed up front; extra flux-like
+    # columns are coerced on demand when additional traces are collected.
+    wavelength_numeric = pd.to_numeric(dataframe[wavelength_col], errors="coerce")
+    flux_numeric = pd.to_numeric(dataframe[flux_col], errors="coerce")
+    valid_rows = (wavelength_numeric.notna() & flux_numeric.notna()).to_numpy()
+    if not valid_rows.any():
         raise ValueError("No numeric spectral samples available in ASCII data")
 
     wavelength_label_unit = _extract_unit_hint(wavelength_col)
@@ -594,7 +687,7 @@ def parse_ascii(
     }
 
     reported_wavelength_unit = wavelength_unit
-    wavelength_series = working[wavelength_col].to_numpy(dtype=float, copy=False)
+    wavelength_series = wavelength_numeric.to_numpy(dtype=float)[valid_rows]
     try:
         wavelength_quantity, canonical_wavelength_unit = to_nm(
             wavelength_series, wavelength_unit
@@ -610,7 +703,7 @@ def parse_ascii(
     )
     metadata.setdefault("reported_wavelength_unit", reported_wavelength_unit)
 
-    flux_values = working[flux_col].to_numpy(dtype=float, copy=False)
+    flux_values = flux_numeric.to_numpy(dtype=float)[valid_rows]
     flux_unit_label = header_flux_hint or metadata.get("flux_unit")
     label_flux_unit = _extract_flux_unit_from_label(flux_col)
     if label_flux_unit:
@@ -618,18 +711,14 @@ def parse_ascii(
     flux_unit, flux_kind = _normalise_flux_unit(flux_unit_label)
     metadata["flux_unit"] = flux_unit
 
-    metadata["wavelength_range_nm"] = [
-        float(np.nanmin(wavelength_nm_values)),
-        float(np.nanmax(wavelength_nm_values)),
-    ]
+    # Rows with a missing wavelength were dropped above, so plain reductions
+    # suffice and each runs once.
+    data_range = [float(wavelength_nm_values.min()), float(wavelength_nm_values.max())]
+    metadata["wavelength_range_nm"] = list(data_range)
     metadata.setdefault("wavelength_effective_range_nm", metadata["wavelength_range_nm"])
     if flux_unit_label and not metadata.get("reported_flux_unit"):
         metadata["reported_flux_unit"] = flux_unit_label
 
-    data_range = [
-        float(np.nanmin(wavelength_nm_values)),
-        float(np.nanmax(wavelength_nm_values)),
-    ]
     metadata.setdefault("data_wavelength_range_nm", data_range)
     metadata.setdefault("wavelength_range_nm", data_range)
     metadata.setdefault(
@@ -667,45 +756,40 @@ def parse_ascii(
 
     label_hint = next((candidate for candidate in label_candidates if candidate), None)
 
-    numeric_valid = numeric.loc[working.index].copy()
-    numeric_valid["__wavelength_nm"] = wavelength_nm_values
-
     additional_traces: List[Dict[str, object]] = []
+    spectral_columns = {wavelength_col, flux_col}
+    available_columns = set(dataframe.columns)
     for column in column_labels:
-        if column in {wavelength_col, flux_col}:
-            continue
-        if column not in numeric_valid.columns:
+        if column in spectral_columns or column not in available_columns:
             continue
         if not _is_flux_like_label(column):
             continue
-        series = numeric_valid[column]
-        if series is None:
-            continue
-        series_values = series.to_numpy(dtype=float, copy=False)
+        series_values = pd.to_numeric(dataframe[column], errors="coerce").to_numpy(dtype=float)[
+            valid_rows
+        ]
         finite_mask = np.isfinite(series_values)
-        if int(np.count_nonzero(finite_mask)) < 3:
+        finite_count = int(np.count_nonzero(finite_mask))
+        if finite_count < 3:
             continue
-        indices = series.index[finite_mask]
-        subset = numeric_valid.loc[indices, ["__wavelength_nm", column]]
-        if subset.empty:
-            continue
-        wavelengths_extra = subset["__wavelength_nm"].to_numpy(dtype=float, copy=False)
-        flux_extra = subset[column].to_numpy(dtype=float, copy=False)
-        tiers = build_downsample_tiers(
-            np.asarray(wavelengths_extra, dtype=float),
-            np.asarray(flux_extra, dtype=float),
-
-            strategy="lttb",
-
-        )
-        extra_metadata = dict(metadata)
-        extra_metadata["points"] = int(wavelengths_extra.size)
+        if finite_count == series_values.size:
+            # Fully populated companion columns share the main grid as-is.
+            wavelengths_extra = wavelength_nm_values
+            flux_extra = series_values
+        else:
+            wavelengths_extra = wavelength_nm_values[finite_mask]
+            flux_extra = series_values[finite_mask]
+        tiers = build_downsample_tiers(wavelengths_extra, flux_extra, strategy="lttb")
+        # Traces only differ from the file metadata in their point count, so
+        # each one layers that key over the shared mapping instead of copying
+        # it; consumers read it (and the UI flattens it with ``dict``).
+        extra_metadata = ChainMap({"points": int(wavelengths_extra.size)}, metadata)
+        extra_wavelength_values = wavelengths_extra.tolist()
         additional_traces.append(
             {
                 "label": str(column),
-                "wavelength_nm": wavelengths_extra.tolist(),
+                "wavelength_nm": extra_wavelength_values,
                 "wavelength": {
-                    "values": wavelengths_extra.tolist(),
+                    "values": extra_wavelength_values,
                     "unit": "nm",
                 },
                 "wavelength_quantity": u.Quantity(wavelengths_extra, u.nm),
@@ -715,22 +799,17 @@ def parse_ascii(
                 "axis": axis,
                 "metadata": extra_metadata,
                 "summary": _series_summary(len(wavelengths_extra), extra_metadata, flux_unit),
-                "downsample": {
-                    int(level): {
-                        "wavelength_nm": list(result.wavelength_nm),
-                        "flux": list(result.flux),
-                    }
-                    for level, result in tiers.items()
-                },
+                "downsample": _downsample_payload(tiers),
             }
         )
 
+    wavelength_values = wavelength_nm_values.tolist()
     payload: Dict[str, object] = {
         "label_hint": label_hint,
-        "wavelength_nm": wavelength_nm_values.tolist(),
-        "wavelength": {"values": wavelength_nm_values.tolist(), "unit": "nm"},
+        "wavelength_nm": wavelength_values,
+        "wavelength": {"values": wavelength_values, "unit": "nm"},
         "wavelength_quantity": wavelength_quantity,
-        "flux": np.asarray(flux_values, dtype=float).tolist(),
+        "flux": flux_values.tolist(),
         "flux_unit": flux_unit,
         "flux_kind": flux_kind,
         "metadata": metadata,
@@ -745,14 +824,221 @@ def parse_ascii(
     return payload
 
 
+_DenseSegment = Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, int]
+_FORTRAN_EXPONENT_TABLE = bytes.maketrans(b"Dd", b"EE")
+_DENSE_ROW_BYTES_ESTIMATE = 32
+# First bytes that can begin a float literal: digits, sign, point, nan/inf.
+_NUMERIC_LEAD_BYTES = frozenset(b"0123456789+-.nNiI")
+# A row whose first non-blank byte is ASCII but cannot start a float literal
+# (digits, sign, point, "nan"/"inf") is never a sample row. Matches begin at
+# the preceding newline, which is much faster than a MULTILINE ``^`` anchor;
+# the numeric block always opens with a sample row, so nothing is missed.
+_NON_NUMERIC_ROW = re.compile(
+    rb"\n[ \t\x0b\x0c]*[^0-9+\-.nNiI \t\x0b\x0c\r\n\x80-\xff][^\r\n]*\r?(?=\n|$)"
+)
+
+
+def _parse_numeric_bytes(token: bytes) -> Optional[float]:
+    # ``float`` accepts ASCII bytes directly; tokens come from ``bytes.split``
+    # of a row already passed through ``_FORTRAN_EXPONENT_TABLE``, so they are
+    # never empty or padded and carry "E" exponents. Tokens that cannot start
+    # a float literal are rejected on their first byte without raising.
+    if token[0] not in _NUMERIC_LEAD_BYTES:
+        return None
+    try:
+        return float(token)
+    except ValueError:
+        return None
+
+
+def _is_dense_data_row(tokens: Sequence[bytes]) -> bool:
+    return (
+        len(tokens) >= 2
+        and _parse_numeric_bytes(tokens[0]) is not None
+        and _parse_numeric_bytes(tokens[1]) is not None
+    )
+
+
+def _parse_dense_segment_bulk(payload: bytes) -> Optional[_DenseSegment]:
+    """Parse a regular whitespace-delimited segment with pandas' C tokenizer.
+
+    Only the header block is scanned line by line. Comment or text rows
+    interleaved with the samples are stripped with one regex pass and counted
+    as skipped, and ragged rows are re-read as three padded columns. Returns
+    ``None`` whenever the numeric block is otherwise irregular (short rows,
+    non-numeric fields) so the caller can fall back to the line parser, which
+    owns the remaining row-skipping rules.
+    """
+
+    headers: List[str] = []
+    offset = 0
+    size = len(payload)
+    while True:
+        if offset >= size:
+            return None
+        newline = payload.find(b"\n", offset)
+        end = size if newline < 0 else newline + 1
+        raw = payload[offset:end]
+        tokens = raw.translate(_FORTRAN_EXPONENT_TABLE).split()
+        if tokens:
+            if _is_dense_data_row(tokens):
+                break
+            # Only header lines are decoded; sample rows stay bytes.
+            headers.append(raw.rstrip(b"\n").rstrip(b"\r").decode("utf-8", errors="ignore"))
+        offset = end
+
+    # Fortran exponents ("1.0D+03") are fixed up for the whole numeric block in
+    # one C-level pass rather than per token.
+    numeric = payload[offset:].translate(_FORTRAN_EXPONENT_TABLE)
+    # Interleaved comment or text rows are the usual irregularity. A row whose
+    # first token cannot begin a float is one the line parser would skip, so
+    # drop those in one regex pass before tokenizing; a failed read_csv costs
+    # nearly as much as a successful one. Bare CR line breaks are left to the
+    # line parser, which splits on them.
+    stripped_numeric, skipped_rows = _NON_NUMERIC_ROW.subn(b"", numeric)
+    if skipped_rows:
+        if numeric.count(b"\r") != numeric.count(b"\r\n"):
+            return None
+        numeric = stripped_numeric
+    columns = _read_dense_block(numeric)
+    if columns is None:
+        return None
+    wavelengths, flux, auxiliary = columns
+    return headers, wavelengths, flux, auxiliary, skipped_rows
+
+
+def _read_dense_csv(numeric: bytes, **layout: object) -> pd.DataFrame:
+    return pd.read_csv(
+        io.BytesIO(numeric),
+        sep=r"\s+",
+        header=None,
+        engine="c",
+        dtype=np.float64,
+        float_precision="round_trip",
+        skip_blank_lines=True,
+        encoding_errors="ignore",
+        **layout,
+    )
+
+
+def _read_dense_block(numeric: bytes) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    try:
+        frame = _read_dense_csv(numeric)
+    except (pd.errors.ParserError, ValueError):
+        # Ragged rows (an uncertainty column that comes and goes, trailing
+        # extra or non-numeric fields) are re-read as exactly three columns:
+        # short rows are padded with NaN and fields past the third are
+        # ignored, matching what the line parser keeps.
+        try:
+            frame = _read_dense_csv(numeric, names=[0, 1, 2], usecols=[0, 1, 2])
+        except (pd.errors.ParserError, ValueError):
+            return None
+    if frame.shape[1] < 2 or frame.empty:
+        return None
+    values = frame.to_numpy(dtype=np.float64, copy=False)
+    wavelengths = np.ascontiguousarray(values[:, 0])
+    flux = np.ascontiguousarray(values[:, 1])
+    # Missing fields surface as NaN; the line parser decides how to treat them.
+    if np.isnan(wavelengths).any() or np.isnan(flux).any():
+        return None
+    if values.shape[1] >= 3:
+        auxiliary = np.ascontiguousarray(values[:, 2])
+    else:
+        auxiliary = np.full(wavelengths.size, np.nan)
+    return wavelengths, flux, auxiliary
+
+
+class _GrowBuffer:
+    """Append-only float64 buffer that grows geometrically in place."""
+
+    __slots__ = ("_buffer", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        self._buffer = np.empty(max(int(capacity), 16), dtype=np.float64)
+        self._size = 0
+
+    def append(self, value: float) -> None:
+        if self._size == self._buffer.size:
+            self._grow(self._size + 1)
+        self._buffer[self._size] = value
+        self._size += 1
+
+    def _grow(self, required: int) -> None:
+        grown = np.empty(max(required, int(self._buffer.size * 1.5)), dtype=np.float64)
+        grown[: self._size] = self._buffer[: self._size]
+        self._buffer = grown
+
+    def view(self) -> np.ndarray:
+        return self._buffer[: self._size]
+
+
+def _parse_dense_segment_lines(payload: bytes) -> _DenseSegment:
+    # Rows are tokenised as bytes; only lines kept as segment headers are
+    # decoded, so the numeric body never goes through the UTF-8 decoder.
+    segment_headers: List[str] = []
+    # Size the buffers from the payload up front; a sample row is rarely
+    # shorter than ~32 bytes, so growth is the exception.
+    estimated_rows = len(payload) // _DENSE_ROW_BYTES_ESTIMATE + 1
+    wavelengths = _GrowBuffer(estimated_rows)
+    flux_values = _GrowBuffer(estimated_rows)
+    auxiliary = _GrowBuffer(estimated_rows)
+    skipped_rows = 0
+    data_started = False
+    nan = float("nan")
+    for raw in payload.splitlines():
+        # Exponents are fixed up once per row; ``raw`` stays untouched for
+        # the header text.
+        tokens = raw.translate(_FORTRAN_EXPONENT_TABLE).split()
+        if not tokens:
+            continue
+        first = second = None
+        if len(tokens) >= 2:
+            first = _parse_numeric_bytes(tokens[0])
+            second = _parse_numeric_bytes(tokens[1])
+        if first is None or second is None:
+            if not data_started:
+                segment_headers.append(raw.decode("utf-8", errors="ignore"))
+            else:
+                skipped_rows += 1
+            continue
+        data_started = True
+        wavelengths.append(first)
+        flux_values.append(second)
+        third_value: Optional[float] = None
+        if len(tokens) >= 3:
+            third_value = _parse_numeric_bytes(tokens[2])
+        auxiliary.append(nan if third_value is None else third_value)
+    return (
+        segment_headers,
+        wavelengths.view(),
+        flux_values.view(),
+        auxiliary.view(),
+        skipped_rows,
+    )
+
+
+def _parse_dense_segment(payload: bytes) -> _DenseSegment:
+    segment = _parse_dense_segment_bulk(payload)
+    if segment is None:
+        segment = _parse_dense_segment_lines(payload)
+    return segment
+
+
 def parse_ascii_segments(
     segments: Sequence[Tuple[str, bytes]] | Iterable[Tuple[str, bytes]],
     *,
     root_filename: Optional[str] = None,
     chunk_size: int = 500_000,
     assumed_unit: str = "nm",
+    max_workers: int = 4,
 ) -> Dict[str, object]:
-    """Parse a collection of ASCII spectrum segments into a unified payload."""
+    """Parse a collection of ASCII spectrum segments into a unified payload.
+
+    Multiple segments are tokenised on a thread pool; pandas' C tokenizer and
+    the NumPy passes release the GIL, so archives with several members parse
+    concurrently. Results are merged in input order, and the checksum is
+    accumulated on the calling thread while the workers run.
+    """
 
     if isinstance(segments, Sequence):
         iterable = list(segments)
@@ -761,56 +1047,37 @@ def parse_ascii_segments(
     if not iterable:
         raise ValueError("No ASCII segments provided for parsing")
 
-    checksum = hashlib.sha256()
+    checksum = hashlib.sha256(usedforsecurity=False)
     header_lines: List[str] = []
     total_samples = 0
     skipped_rows = 0
     segment_summaries: List[Dict[str, object]] = []
 
-    wavelengths = array("d")
-    flux_values = array("d")
-    auxiliary = array("d")
-    auxiliary_used = False
-
-    for name, payload in iterable:
-        checksum.update(payload)
-        stream = io.BytesIO(payload)
-        reader = io.TextIOWrapper(stream, encoding="utf-8", errors="ignore")
-        segment_headers: List[str] = []
-        segment_samples = 0
-        data_started = False
-        for raw in reader:
-            stripped = raw.strip()
-            if not stripped:
-                continue
-            tokens = stripped.split()
-            if len(tokens) < 2:
-                if not data_started:
-                    segment_headers.append(raw.rstrip("\n"))
-                else:
-                    skipped_rows += 1
-                continue
-            first = _parse_numeric_token(tokens[0])
-            second = _parse_numeric_token(tokens[1])
-            if first is None or second is None:
-                if not data_started:
-                    segment_headers.append(raw.rstrip("\n"))
-                else:
-                    skipped_rows += 1
-                continue
-            data_started = True
-            wavelengths.append(float(first))
-            flux_values.append(float(second))
-            third_value: Optional[float] = None
-            if len(tokens) >= 3:
-                third_value = _parse_numeric_token(tokens[2])
-            if third_value is None:
-                auxiliary.append(float("nan"))
-            else:
-                auxiliary.append(float(third_value))
-                auxiliary_used = True
-            segment_samples += 1
-            total_samples += 1
+    wavelength_parts: List[np.ndarray] = []
+    flux_parts: List[np.ndarray] = []
+    auxiliary_parts: List[np.ndarray] = []
+
+    workers = max(1, min(int(max_workers), len(iterable)))
+    if workers == 1:
+        parsed_segments = [_parse_dense_segment(payload) for _, payload in iterable]
+        for _, payload in iterable:
+            checksum.update(payload)
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ascii-segment") as executor:
+            futures = [executor.submit(_parse_dense_segment, payload) for _, payload in iterable]
+            for _, payload in iterable:
+                checksum.update(payload)
+            parsed_segments = [future.result() for future in futures]
+
+    for (name, _), segment in zip(iterable, parsed_segments):
+        segment_headers, segment_wavelengths, segment_flux, segment_aux, segment_skipped = segment
+        segment_samples = int(segment_wavelengths.size)
+        if segment_samples:
+            wavelength_parts.append(segment_wavelengths)
+            flux_parts.append(segment_flux)
+            auxiliary_parts.append(segment_aux)
+        total_samples += segment_samples
+        skipped_rows += segment_skipped
         header_lines.extend(segment_headers)
         segment_summary = {
             "name": name,
@@ -819,12 +1086,20 @@ def parse_ascii_segments(
         }
         segment_summaries.append(segment_summary)
 
-    if not wavelengths:
+    if not wavelength_parts:
         raise ValueError("No numeric samples detected across ASCII segments")
 
-    wavelength_array = np.asarray(wavelengths, dtype=float)
-    flux_array = np.asarray(flux_values, dtype=float)
-    aux_array = np.asarray(auxiliary, dtype=float)
+    if len(wavelength_parts) == 1:
+        # Segment arrays are freshly allocated, so a lone segment needs no copy.
+        wavelength_array, flux_array, aux_array = (
+            wavelength_parts[0],
+            flux_parts[0],
+            auxiliary_parts[0],
+        )
+    else:
+        wavelength_array = np.concatenate(wavelength_parts)
+        flux_array = np.concatenate(flux_parts)
+        aux_array = np.concatenate(auxiliary_parts)
 
     metadata, raw_headers, label_candidates, axis_hint, header_unit_hint, header_flux_hint = _collect_header_metadata(
         header_lines
@@ -849,33 +1124,56 @@ def parse_ascii_segments(
 
     wavelength_nm = np.asarray(wavelength_quantity.to_value(u.nm), dtype=float)
 
-    finite_mask = np.isfinite(wavelength_nm) & np.isfinite(flux_array)
-    dropped_nonfinite = int(finite_mask.size - int(np.count_nonzero(finite_mask)))
+    # Filtering, ordering and de-duplication compose into a single selector so
+    # flux and the auxiliary column are gathered at most once; only the
+    # wavelength grid is materialised between steps because each step reads it.
+    selector: Optional[np.ndarray | slice] = None
+    # Combine in place so the mask costs one boolean buffer plus the flux
+    # temporary, rather than a third array for the ``&`` result.
+    finite_mask = np.isfinite(wavelength_nm)
+    finite_mask &= np.isfinite(flux_array)
+    dropped_nonfinite = finite_mask.size - int(np.count_nonzero(finite_mask))
     if dropped_nonfinite:
-        wavelength_nm = wavelength_nm[finite_mask]
-        flux_array = flux_array[finite_mask]
-        aux_array = aux_array[finite_mask]
-    else:
-        wavelength_nm = np.asarray(wavelength_nm, dtype=float)
-        flux_array = np.asarray(flux_array, dtype=float)
-        aux_array = np.asarray(aux_array, dtype=float)
+        selector = np.flatnonzero(finite_mask)
+        wavelength_nm = wavelength_nm[selector]
 
     if wavelength_nm.size == 0:
         raise ValueError("No numeric samples available after unit normalisation")
 
-    order = np.argsort(wavelength_nm, kind="mergesort")
-    wavelength_nm = wavelength_nm[order]
-    flux_array = flux_array[order]
-    aux_array = aux_array[order]
+    # Instrument output is usually already monotonic (ascending, or strictly
+    # descending once wavenumbers are converted to nm); a linear check spares
+    # the argsort and gathers in those cases.
+    ascending = wavelength_nm[1:] >= wavelength_nm[:-1]
+    if not ascending.all():
+        if not ascending.any():
+            # Strictly descending: reversing is the stable sort.
+            order = slice(None, None, -1)
+        else:
+            order = np.argsort(wavelength_nm, kind="stable")
+        wavelength_nm = wavelength_nm[order]
+        selector = order if selector is None else selector[order]
 
+    # The grid is sorted, so duplicates form runs; keeping the first sample of
+    # each run is one comparison pass instead of np.unique's second sort.
     pre_unique_samples = int(wavelength_nm.size)
-    wavelength_nm, unique_idx = np.unique(wavelength_nm, return_index=True)
-    flux_array = flux_array[unique_idx]
-    aux_array = aux_array[unique_idx]
-    unique_samples = int(wavelength_nm.size)
-    deduplicated_samples = max(pre_unique_samples - unique_samples, 0)
+    keep = np.empty(pre_unique_samples, dtype=bool)
+    keep[0] = True
+    np.not_equal(wavelength_nm[1:], wavelength_nm[:-1], out=keep[1:])
+    unique_samples = int(np.count_nonzero(keep))
+    deduplicated_samples = pre_unique_samples - unique_samples
+    if deduplicated_samples:
+        wavelength_nm = wavelength_nm[keep]
+        # A reversal selector implies a strictly descending grid, which has no
+        # duplicates, so any selector reaching this point is an index array.
+        selector = np.flatnonzero(keep) if selector is None else selector[keep]
+
+    if selector is not None:
+        flux_array = flux_array[selector]
+        aux_array = aux_array[selector]
 
-    auxiliary_used = bool(np.isfinite(aux_array).any())
+    aux_finite = np.isfinite(aux_array)
+    auxiliary_finite_count = int(np.count_nonzero(aux_finite))
+    auxiliary_used = auxiliary_finite_count > 0
 
     flux_unit_label = header_flux_hint or metadata.get("flux_unit")
     flux_unit, flux_kind = _normalise_flux_unit(flux_unit_label)
@@ -884,8 +1182,9 @@ def parse_ascii_segments(
         metadata["reported_flux_unit"] = flux_unit_label
 
     metadata["points"] = int(unique_samples)
-    min_nm = float(np.nanmin(wavelength_nm))
-    max_nm = float(np.nanmax(wavelength_nm))
+    # The grid is finite and sorted at this point, so its ends are the range.
+    min_nm = float(wavelength_nm[0])
+    max_nm = float(wavelength_nm[-1])
     metadata["wavelength_range_nm"] = [min_nm, max_nm]
     metadata.setdefault("wavelength_effective_range_nm", [min_nm, max_nm])
     metadata.setdefault("data_wavelength_range_nm", [min_nm, max_nm])
@@ -922,19 +1221,23 @@ def parse_ascii_segments(
 
     chunk_ranges: List[Dict[str, object]] = []
     if chunk_size > 0:
-        for offset in range(0, wavelength_nm.size, chunk_size):
-            end = min(offset + chunk_size, wavelength_nm.size)
-            segment = wavelength_nm[offset:end]
-            if segment.size == 0:
-                continue
-            chunk_ranges.append(
-                {
-                    "offset": int(offset),
-                    "start_nm": float(segment[0]),
-                    "end_nm": float(segment[-1]),
-                    "samples": int(segment.size),
-                }
+        sample_count = int(wavelength_nm.size)
+        offsets = np.arange(0, sample_count, chunk_size)
+        last_indices = np.minimum(offsets + chunk_size, sample_count) - 1
+        chunk_ranges = [
+            {
+                "offset": offset,
+                "start_nm": start_nm,
+                "end_nm": end_nm,
+                "samples": last - offset + 1,
+            }
+            for offset, last, start_nm, end_nm in zip(
+                offsets.tolist(),
+                last_indices.tolist(),
+                wavelength_nm[offsets].tolist(),
+                wavelength_nm[last_indices].tolist(),
             )
+        ]
     provenance["chunks"] = list(chunk_ranges)
 
     conversions: Dict[str, object] = {}
@@ -966,27 +1269,32 @@ def parse_ascii_segments(
     auxiliary_values: Optional[np.ndarray]
     if auxiliary_used:
         auxiliary_values = aux_array
-        finite_aux = auxiliary_values[np.isfinite(auxiliary_values)]
-        if finite_aux.size:
-            metadata.setdefault(
-                "auxiliary_statistics",
-                {
-                    "min": float(np.nanmin(finite_aux)),
-                    "max": float(np.nanmax(finite_aux)),
-                    "mean": float(np.nanmean(finite_aux)),
-                    "samples": int(finite_aux.size),
-                },
-            )
+        # The finite mask from above is reused; once masked, plain reductions
+        # do the job without the NaN-aware variants' extra copies.
+        if auxiliary_finite_count == auxiliary_values.size:
+            finite_aux = auxiliary_values
+        else:
+            finite_aux = auxiliary_values[aux_finite]
+        metadata.setdefault(
+            "auxiliary_statistics",
+            {
+                "min": float(finite_aux.min()),
+                "max": float(finite_aux.max()),
+                "mean": float(finite_aux.mean()),
+                "samples": auxiliary_finite_count,
+            },
+        )
     else:
         auxiliary_values = None
 
     tiers = build_downsample_tiers(wavelength_nm, flux_array, strategy="lttb")
     provenance["downsample_tiers"] = sorted(int(key) for key in tiers)
 
+    wavelength_values = wavelength_nm.tolist()
     payload = {
         "label_hint": label_hint,
-        "wavelength_nm": wavelength_nm.tolist(),
-        "wavelength": {"values": wavelength_nm.tolist(), "unit": "nm"},
+        "wavelength_nm": wavelength_values,
+        "wavelength": {"values": wavelength_values, "unit": "nm"},
         "flux": flux_array.tolist(),
         "auxiliary": auxiliary_values.tolist() if auxiliary_values is not None else None,
         "flux_unit": flux_unit,
@@ -996,12 +1304,6 @@ def parse_ascii_segments(
         "axis": axis,
         "kind": "spectrum",
         "chunk_ranges": chunk_ranges,
-        "downsample": {
-            int(level): {
-                "wavelength_nm": list(result.wavelength_nm),
-                "flux": list(result.flux),
-            }
-            for level, result in tiers.items()
-        },
+        "downsample": _downsample_payload(tiers),
     }
     return payload
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Optional, Sequence
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 from astropy import units as u
@@ -39,6 +39,27 @@ def _parse_int(value: str) -> Optional[int]:
         return None
 
 
+# Numeric labelled data records that only feed the section context: label ->
+# (context field, parser, metadata key echoing the reported value or None).
+_NUMERIC_CONTEXT_FIELDS: Dict[str, Tuple[str, Callable[[str], Optional[float]], Optional[str]]] = {
+    "XFACTOR": ("x_factor", _parse_float, None),
+    "YFACTOR": ("y_factor", _parse_float, None),
+    "FIRSTX": ("first_x", _parse_float, None),
+    "LASTX": ("last_x", _parse_float, None),
+    "NPOINTS": ("npoints", _parse_int, "reported_points"),
+    "DELTAX": ("delta", _parse_float, None),
+    "FIRSTY": ("first_y", _parse_float, "reported_first_y"),
+    **dict.fromkeys(
+        ("PATHLENGTH", "PATH LENGTH", "PATH_LENGTH"),
+        ("path_length_m", _parse_float, "path_length_reported_m"),
+    ),
+    **dict.fromkeys(
+        ("MOLEFRACTION", "MOLE FRACTION", "MOLE_FRACTION", "MOLFRAC"),
+        ("mole_fraction", _parse_float, "mole_fraction_reported"),
+    ),
+}
+
+
 def _normalise_metadata_key(key: str) -> str:
     cleaned = re.sub(r"[^a-z0-9]+", "_", key.lower()).strip("_")
     return cleaned
@@ -123,7 +144,7 @@ def _collect_number_lines(raw_lines: Sequence[str]) -> List[List[float]]:
     return parsed
 
 
-def parse_jcamp(payload: bytes, filename: Optional[str] = None) -> Dict[str, object]:
+def parse_jcamp(payload: bytes | bytearray, filename: Optional[str] = None) -> Dict[str, object]:
     """Parse a JCAMP-DX spectrum payload into a normalised overlay structure."""
 
     try:
@@ -190,7 +211,15 @@ def parse_jcamp(payload: bytes, filename: Optional[str] = None) -> Dict[str, obj
 
             active_section = None
 
-            if upper == "TITLE":
+            numeric_field = _NUMERIC_CONTEXT_FIELDS.get(upper)
+            if numeric_field is not None:
+                field, parse, reported_key = numeric_field
+                parsed = parse(value_clean)
+                if parsed is not None:
+                    context[field] = parsed
+                    if reported_key is not None:
+                        metadata.setdefault(reported_key, parsed)
+            elif upper == "TITLE":
                 if value_clean:
                     title = value_clean
                     metadata.setdefault("title", value_clean)
@@ -219,46 +248,6 @@ def parse_jcamp(payload: bytes, filename: Optional[str] = None) -> Dict[str, obj
                 if value_clean:
                     context["y_units"] = value_clean
                     metadata.setdefault("reported_flux_unit", value_clean)
-            elif upper == "XFACTOR":
-                parsed = _parse_float(value_clean)
-                if parsed is not None:
-                    context["x_factor"] = parsed
-            elif upper == "YFACTOR":
-                parsed = _parse_float(value_clean)
-                if parsed is not None:
-                    context["y_factor"] = parsed
-            elif upper == "FIRSTX":
-                parsed = _parse_float(value_clean)
-                if parsed is not None:
-                    context["first_x"] = parsed
-            elif upper == "LASTX":
-                parsed = _parse_float(value_clean)
-                if parsed is not None:
-                    context["last_x"] = parsed
-            elif upper == "NPOINTS":
-                parsed = _parse_int(value_clean)
-                if parsed is not None:
-                    context["npoints"] = parsed
-                    metadata.setdefault("reported_points", parsed)
-            elif upper == "DELTAX":
-                parsed = _parse_float(value_clean)
-                if parsed is not None:
-                    context["delta"] = parsed
-            elif upper == "FIRSTY":
-                parsed = _parse_float(value_clean)
-                if parsed is not None:
-                    context["first_y"] = parsed
-                    metadata.setdefault("reported_first_y", parsed)
-            elif upper in {"PATHLENGTH", "PATH LENGTH", "PATH_LENGTH"}:
-                parsed = _parse_float(value_clean)
-                if parsed is not None:
-                    context["path_length_m"] = parsed
-                    metadata.setdefault("path_length_reported_m", parsed)
-            elif upper in {"MOLEFRACTION", "MOLE FRACTION", "MOLE_FRACTION", "MOLFRAC"}:
-                parsed = _parse_float(value_clean)
-                if parsed is not None:
-                    context["mole_fraction"] = parsed
-                    metadata.setdefault("mole_fraction_reported", parsed)
             elif upper == "END":
                 # terminator marker — nothing to record
                 continue
@@ -309,6 +298,7 @@ def parse_jcamp(payload: bytes, filename: Optional[str] = None) -> Dict[str, obj
     ]
 
     step: Optional[float] = None
+    x_chunks: List[np.ndarray] = []
     if use_delta:
         step = infer_step(line_start_values, float(delta)) if delta is not None else 0.0
         for numbers in section_lines:
@@ -316,9 +306,10 @@ def parse_jcamp(payload: bytes, filename: Optional[str] = None) -> Dict[str, obj
             samples = numbers[1:]
             if not samples:
                 continue
-            for index, sample in enumerate(samples):
-                x_values.append(base + index * (step or 0.0))
-                raw_y_values.append(sample)
+            # Integer sample offsets keep the grid length exact (no float
+            # accumulation as with a float-stepped arange).
+            x_chunks.append(base + np.arange(len(samples), dtype=float) * (step or 0.0))
+            raw_y_values.extend(samples)
     else:
         for numbers in section_lines:
             if len(numbers) < 2:
@@ -331,10 +322,12 @@ def parse_jcamp(payload: bytes, filename: Optional[str] = None) -> Dict[str, obj
                 x_values.append(x_raw * x_factor)
                 raw_y_values.append(y_raw)
 
-    if not x_values or not raw_y_values:
+    wavelength_array = (
+        np.concatenate(x_chunks) if x_chunks else np.asarray(x_values, dtype=float)
+    )
+    if not wavelength_array.size or not raw_y_values:
         raise ValueError("JCAMP payload did not produce any spectral samples")
 
-    wavelength_array = np.asarray(x_values, dtype=float)
     raw_flux_array = np.asarray(raw_y_values, dtype=float)
     scaled_flux_array = raw_flux_array * y_factor
     finite = np.isfinite(wavelength_array) & np.isfinite(scaled_flux_array)
@@ -466,9 +459,12 @@ def parse_jcamp(payload: bytes, filename: Optional[str] = None) -> Dict[str, obj
     if conversion_error:
         metadata["ir_conversion_error"] = conversion_error
 
+    # Samples were filtered to finite values before the unit conversion, so
+    # the NaN-skipping reductions are unnecessary here. JCAMP X axes may run
+    # in either direction (or be unordered XYPOINTS), so the ends are not used.
     metadata.setdefault("wavelength_range_nm", [
-        float(np.nanmin(wavelength_nm)),
-        float(np.nanmax(wavelength_nm)),
+        float(wavelength_nm.min()),
+        float(wavelength_nm.max()),
     ])
     metadata.setdefault(
         "data_wavelength_range_nm",
@@ -548,10 +544,12 @@ def parse_jcamp(payload: bytes, filename: Optional[str] = None) -> Dict[str, obj
 
     label_hint = next((candidate for candidate in [names[0] if names else None, title]), None)
 
+    wavelength_values = wavelength_nm.tolist()
+
     payload: Dict[str, object] = {
         "label_hint": label_hint,
-        "wavelength_nm": wavelength_nm.tolist(),
-        "wavelength": {"values": wavelength_nm.tolist(), "unit": "nm"},
+        "wavelength_nm": wavelength_values,
+        "wavelength": {"values": wavelength_values, "unit": "nm"},
         "wavelength_quantity": wavelength_quantity,
         "flux": final_flux_array.tolist(),
         "flux_unit": flux_unit,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Iterable, Tuple
+from functools import lru_cache
+from typing import Callable, Iterable, Optional, Tuple
 
 import numpy as np
 from astropy import units as u
@@ -86,15 +87,29 @@ def _as_unit(unit: str | u.UnitBase | Quantity) -> u.UnitBase:
                     raise ValueError(f"Unsupported wavelength unit: {unit}") from imperial_exc
 
 
+def _canonical_label(parsed: u.UnitBase) -> str:
+    try:
+        return parsed.to_string(format="fits")
+    except UnitScaleError:
+        return parsed.to_string()
+
+
+@lru_cache(maxsize=64)
+def _resolve_unit_text(text: str) -> Tuple[u.UnitBase, str]:
+    # Parsing and FITS-formatting a unit string costs hundreds of microseconds
+    # for anything beyond the "nm"/Angstrom fast paths, and files repeat the
+    # same handful of labels.
+    parsed = _as_unit(text)
+    return parsed, _canonical_label(parsed)
+
+
 def resolve_unit(unit: str | u.UnitBase | Quantity) -> Tuple[u.UnitBase, str]:
     """Return a parsed unit and its canonical string label."""
 
+    if isinstance(unit, str):
+        return _resolve_unit_text(unit)
     parsed = _as_unit(unit)
-    try:
-        canonical = parsed.to_string(format="fits")
-    except UnitScaleError:
-        canonical = parsed.to_string()
-    return parsed, canonical
+    return parsed, _canonical_label(parsed)
 
 
 def quantity_from(
@@ -117,19 +132,41 @@ def to_nm(
 
     quantity, canonical = quantity_from(values, unit)
 
+    scale = _linear_nm_scale(quantity.unit)
+    if scale is not None:
+        return u.Quantity(quantity.value * scale, u.nm, copy=False), canonical
+
+    try:
+        converter, is_wavenumber = _spectral_nm_converter(quantity.unit)
+    except Exception as exc:  # pragma: no cover - astropy specific
+        raise ValueError(f"Unsupported wavelength unit: {unit}") from exc
+    if is_wavenumber and np.any(np.asarray(quantity.value) == 0.0):
+        raise ValueError("Cannot convert a zero wavenumber to wavelength")
+
+    return u.Quantity(converter(quantity.value), u.nm, copy=False), canonical
+
+
+@lru_cache(maxsize=64)
+def _linear_nm_scale(unit: u.UnitBase) -> Optional[float]:
+    """Return the factor taking ``unit`` to nanometres, or ``None`` if non-linear."""
+
     try:
-        converted = quantity.to(u.nm)
+        return float(unit.to(u.nm))
     except u.UnitConversionError:
-        if quantity.unit.is_equivalent(u.m**-1) and np.any(
-            np.asarray(quantity.value) == 0.0
-        ):
-            raise ValueError("Cannot convert a zero wavenumber to wavelength")
-        try:
-            converted = quantity.to(u.nm, equivalencies=u.spectral())
-        except Exception as exc:  # pragma: no cover - astropy specific
-            raise ValueError(f"Unsupported wavelength unit: {unit}") from exc
+        return None
+
+
+@lru_cache(maxsize=64)
+def _spectral_nm_converter(unit: u.UnitBase) -> Tuple[Callable[[np.ndarray], np.ndarray], bool]:
+    """Return astropy's spectral converter from ``unit`` to nanometres.
+
+    Building ``u.spectral()`` and searching it for a conversion path dominates
+    ``Quantity.to`` for frequency, energy and wavenumber axes; the resolved
+    converter applies the same arithmetic, so results are unchanged.
+    """
 
-    return converted, canonical
+    converter = unit.get_converter(u.nm, equivalencies=u.spectral())
+    return converter, unit.is_equivalent(u.m**-1)
 
 
 def canonical_unit(unit: str | u.UnitBase | Quantity) -> str:
@@ -3050,18 +3050,6 @@ def _render_local_upload() -> None:
     registry = _get_upload_registry()
 
     for uploaded in uploader:
-        try:
-            payload_bytes = uploaded.getvalue()
-        except Exception as exc:  # pragma: no cover - Streamlit defensive branch
-            st.warning(f"Unable to read {uploaded.name}: {exc}")
-            continue
-
-        if not payload_bytes:
-            st.warning(f"{uploaded.name} is empty; skipping upload.")
-            continue
-
-        checksum = hashlib.sha256(payload_bytes).hexdigest()
-
         checksum, payload_bytes, error_message, level = _read_uploaded_file(uploaded)
         if error_message:
             (st.error if level == "error" else st.warning)(error_message)
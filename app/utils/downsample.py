@@ -34,7 +34,10 @@ def _as_float_array(values: Sequence[float]) -> np.ndarray:
     mask = np.isfinite(array)
     if not np.all(mask):
         array = array[mask]
-    return array.astype(float, copy=False)
+    # Strided views (e.g. a DataFrame column slice) are packed once here so
+    # the bucket loops below walk unit-stride memory; contiguous input is
+    # returned unchanged.
+    return np.ascontiguousarray(array)
 
 
 def _ensure_sorted_unique(
@@ -46,11 +49,20 @@ def _ensure_sorted_unique(
         raise ValueError("Wavelength and flux sequences must be equal length")
     if x.size == 0:
         return x, y
-    order = np.argsort(x, kind="mergesort")
-    x = x[order]
-    y = y[order]
-    x, unique_idx = np.unique(x, return_index=True)
-    y = y[unique_idx]
+    # Callers usually pass an already ordered grid (every tier re-enters
+    # here with the output of the previous call), so a linear check spares
+    # the sort; duplicates then form runs and keeping the first of each run
+    # matches ``np.unique(..., return_index=True)`` without a second sort.
+    if not (x[1:] >= x[:-1]).all():
+        order = np.argsort(x, kind="stable")
+        x = x[order]
+        y = y[order]
+    keep = np.empty(x.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(x[1:], x[:-1], out=keep[1:])
+    if not keep.all():
+        x = x[keep]
+        y = y[keep]
     return x, y
 
 
@@ -164,6 +164,21 @@ def _parse_vertical_series(lines: Sequence[str]) -> Tuple[pd.DataFrame, List[str
     return dataframe, column_labels
 
 
+def _read_delimited(text: str, delimiter: str) -> pd.DataFrame:
+    """Parse delimited rows, preferring pandas' C tokenizer.
+
+    The sniffed delimiters are all single characters, which the C engine
+    handles natively; the Python engine remains as a fallback for rows it
+    rejects so tolerance for messy uploads is unchanged.
+    """
+
+    options = dict(sep=delimiter, comment="#", skip_blank_lines=True, header=None)
+    try:
+        return pd.read_csv(io.StringIO(text), engine="c", **options)
+    except (pd.errors.ParserError, ValueError):
+        return pd.read_csv(io.StringIO(text), engine="python", **options)
+
+
 def read_table(
     file_bytes: bytes,
     *,
@@ -217,14 +232,7 @@ def read_table(
     parse_error: Exception | None = None
 
     try:
-        dataframe = pd.read_csv(
-            io.StringIO("\n".join(data_lines)),
-            sep=delimiter,
-            engine="python",
-            comment="#",
-            skip_blank_lines=True,
-            header=None,
-        )
+        dataframe = _read_delimited("\n".join(data_lines), delimiter)
         if dataframe.shape[1] < 2:
             raise ValueError("Expected at least two columns (wavelength and flux).")
 
@@ -236,7 +244,12 @@ def read_table(
 
         numeric_cols = dataframe.columns[:2]
         for column in numeric_cols:
-            dataframe[column] = pd.to_numeric(dataframe[column], errors="coerce")
+            values = dataframe[column]
+            # read_csv already infers clean numeric columns as float/int;
+            # only columns holding stray text need coercing and reassigning.
+            if isinstance(values, pd.Series) and pd.api.types.is_numeric_dtype(values.dtype):
+                continue
+            dataframe[column] = pd.to_numeric(values, errors="coerce")
 
         dataframe = dataframe.dropna(subset=list(numeric_cols)).reset_index(drop=True)
         if dataframe.empty:
@@ -31,3 +31,18 @@ def test_resample_raises_when_no_overlap():
 
     with pytest.raises(ValueError, match="Wavelength ranges do not overlap"):
         resample_to_common_grid(wl_a, fl_a, wl_b, fl_b)
+
+
+def test_resample_skips_sort_for_ascending_inputs(monkeypatch):
+    from app.server import differential
+
+    def forbidden_argsort(*args, **kwargs):  # pragma: no cover - guard
+        raise AssertionError("ascending inputs must not be re-sorted")
+
+    monkeypatch.setattr(differential.np, "argsort", forbidden_argsort)
+
+    grid, fa, fb = resample_to_common_grid([1, 2, 2, 4], [10, 20, 20, 40], [2, 3], [20, 30], n=2)
+
+    assert grid == pytest.approx([2.0, 3.0])
+    assert fa == pytest.approx([20.0, 30.0])
+    assert fb == pytest.approx([20.0, 30.0])
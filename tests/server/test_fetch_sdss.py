@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+from astropy import units as u
+from astropy.io import fits
+
+from app.server.fetchers import sdss
+
+
+def _spectrum_bytes() -> bytes:
+    loglam = np.linspace(3.5798, 3.5808, 16)
+    flux = np.linspace(10.0, 25.0, 16)
+    ivar = np.full(16, 4.0)
+    ivar[3] = 0.0
+    columns = [
+        fits.Column(name="loglam", format="E", array=loglam.astype(np.float32)),
+        fits.Column(name="flux", format="E", array=flux.astype(np.float32)),
+        fits.Column(name="ivar", format="E", array=ivar.astype(np.float32)),
+    ]
+    hdul = fits.HDUList(
+        [fits.PrimaryHDU(), fits.BinTableHDU.from_columns(columns)]
+    )
+    buffer = io.BytesIO()
+    hdul.writeto(buffer)
+    return buffer.getvalue()
+
+
+class _StreamingResponse:
+    def __init__(
+        self, body: bytes, status_code: int = 200, headers: dict | None = None
+    ) -> None:
+        self._body = body
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+
+    def __enter__(self) -> "_StreamingResponse":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size: int = 1):
+        for start in range(0, len(self._body), chunk_size):
+            yield self._body[start : start + chunk_size]
+
+
+@pytest.fixture(autouse=True)
+def _clear_parse_cache():
+    sdss._parsed_cached.cache_clear()
+    sdss._hashed_cached.cache_clear()
+    yield
+    sdss._parsed_cached.cache_clear()
+    sdss._hashed_cached.cache_clear()
+
+
+def test_fetch_hashes_download_without_rereading(monkeypatch, tmp_path):
+    body = _spectrum_bytes()
+    urls: List[str] = []
+
+    def fake_get(url, *args, **kwargs):
+        urls.append(url)
+        return _StreamingResponse(body)
+
+    def fail_sha256(path: Path) -> str:  # pragma: no cover - defensive
+        raise AssertionError("fresh downloads should be hashed while streaming")
+
+    monkeypatch.setattr(sdss._SESSION, "get", fake_get)
+    monkeypatch.setattr(sdss, "_sha256", fail_sha256)
+
+    payload = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+
+    assert len(urls) == 1
+    meta = payload["meta"]
+    assert meta["cache_hit"] is False
+    assert meta["file_hash_sha256"] == hashlib.sha256(body).hexdigest()
+    assert Path(meta["cache_path"]).read_bytes() == body
+    assert type(payload["wavelength_nm"]) is list
+    assert type(payload["intensity"][0]) is float
+
+
+def test_fetch_cache_hit_hashes_local_file(monkeypatch, tmp_path):
+    body = _spectrum_bytes()
+    monkeypatch.setattr(
+        sdss._SESSION, "get", lambda url, *args, **kwargs: _StreamingResponse(body)
+    )
+    first = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+
+    def fail_get(*args, **kwargs):  # pragma: no cover - defensive
+        raise AssertionError("cache hits must not touch the network")
+
+    monkeypatch.setattr(sdss._SESSION, "get", fail_get)
+    second = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+
+    assert second["meta"]["cache_hit"] is True
+    assert second["meta"]["file_hash_sha256"] == first["meta"]["file_hash_sha256"]
+
+
+def test_download_missing_spectrum_raises(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        sdss._SESSION,
+        "get",
+        lambda url, *args, **kwargs: _StreamingResponse(b"", status_code=404),
+    )
+
+    with pytest.raises(sdss.SdssFetchError):
+        sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+
+
+def test_session_pools_connections_and_retries_server_errors():
+    adapter = sdss._SESSION.get_adapter(sdss.BASE_URL)
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 8
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+    assert 404 not in adapter.max_retries.status_forcelist
+
+
+def test_parse_matches_astropy_unit_conversion(tmp_path):
+    path = tmp_path / "spec.fits"
+    path.write_bytes(_spectrum_bytes())
+
+    spectrum = sdss._parse_sdss_spectrum(path)
+
+    with fits.open(path) as hdul:
+        table = hdul[1].data
+        loglam = np.asarray(table["loglam"], dtype=float)
+        flux = np.asarray(table["flux"], dtype=float)
+        ivar = np.asarray(table["ivar"], dtype=float)
+    flux_unit = 1e-17 * u.erg / (u.s * u.cm**2 * u.AA)
+    target_unit = u.erg / (u.s * u.cm**2 * u.nm)
+    expected_wavelength = (np.power(10.0, loglam) * u.AA).to(u.nm).value
+    expected_flux = (flux * flux_unit).to(target_unit).value
+    with np.errstate(divide="ignore"):
+        sigma = np.sqrt(np.where(ivar > 0.0, 1.0 / ivar, np.nan))
+    expected_sigma = (sigma * flux_unit).to(target_unit).value
+
+    np.testing.assert_allclose(spectrum["wavelength_nm"], expected_wavelength, rtol=1e-12)
+    np.testing.assert_allclose(spectrum["flux"], expected_flux, rtol=1e-12)
+    np.testing.assert_allclose(
+        spectrum["uncertainty"], expected_sigma, rtol=1e-12, equal_nan=True
+    )
+    assert np.isnan(spectrum["uncertainty"][3])
+
+
+def test_cache_hits_reuse_parsed_spectrum(monkeypatch, tmp_path):
+    body = _spectrum_bytes()
+    monkeypatch.setattr(
+        sdss._SESSION, "get", lambda url, *args, **kwargs: _StreamingResponse(body)
+    )
+    parse_calls: List[Path] = []
+    original_parse = sdss._parse_sdss_spectrum
+
+    def counting_parse(path: Path):
+        parse_calls.append(path)
+        return original_parse(path)
+
+    monkeypatch.setattr(sdss, "_parse_sdss_spectrum", counting_parse)
+
+    first = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+    second = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+    third = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+
+    assert len(parse_calls) == 1
+    assert first["wavelength_nm"] == second["wavelength_nm"] == third["wavelength_nm"]
+    assert (
+        second["meta"]["file_hash_sha256"]
+        == third["meta"]["file_hash_sha256"]
+        == hashlib.sha256(body).hexdigest()
+    )
+
+    sdss.fetch("6138-56598-0934", cache_dir=tmp_path, force_refresh=True)
+    assert len(parse_calls) == 2
+
+
+def test_parsed_cache_returns_read_only_arrays(tmp_path):
+    path = tmp_path / "spec.fits"
+    path.write_bytes(_spectrum_bytes())
+    stat = path.stat()
+
+    parsed = sdss._parsed_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+    for array in (parsed.wavelength_nm, parsed.flux, parsed.uncertainty):
+        assert not array.flags.writeable
+    assert parsed.wavelength_bounds == (
+        float(parsed.wavelength_nm.min()),
+        float(parsed.wavelength_nm.max()),
+    )
+
+
+def test_available_targets_are_shared_read_only_records():
+    first = sdss.available_targets()
+    second = sdss.available_targets()
+
+    assert first is second
+    assert [record["plate"] for record in first] == [6138, 6138, 2821, 3128]
+    assert "6138565980934" in first[0]["search_tokens"]
+    with pytest.raises(TypeError):
+        first[0]["plate"] = 0  # type: ignore[index]
+
+
+def _linear_prefix_match(token: str):
+    for entry in sdss._TARGETS:
+        for alias in entry.search_tokens:
+            if alias.startswith(token) or token.startswith(alias):
+                return entry
+    return None
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["SDSS J2348", "sdss j", "6138", "2821-54393", "Gaia DR3", "3128547760178extra", "zzz"],
+)
+def test_prefix_match_agrees_with_linear_scan(query):
+    token = sdss._normalise_token(query)
+
+    assert sdss._prefix_match(token) is _linear_prefix_match(token)
+
+
+def test_resolve_target_by_partial_name():
+    entry = sdss._resolve_target("SDSS J2343")
+
+    assert entry.slug == "6138-56598-0716"
+    with pytest.raises(sdss.SdssFetchError):
+        sdss._resolve_target("Vega")
+
+
+def test_cache_hit_hashes_on_worker_thread(monkeypatch, tmp_path):
+    body = _spectrum_bytes()
+    monkeypatch.setattr(
+        sdss._SESSION, "get", lambda url, *args, **kwargs: _StreamingResponse(body)
+    )
+    sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+
+    hashing_threads: List[str] = []
+    original_sha256 = sdss._sha256
+
+    def recording_sha256(path: Path) -> str:
+        hashing_threads.append(threading.current_thread().name)
+        return original_sha256(path)
+
+    monkeypatch.setattr(sdss, "_sha256", recording_sha256)
+    payload = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+
+    assert payload["meta"]["file_hash_sha256"] == hashlib.sha256(body).hexdigest()
+    assert len(hashing_threads) == 1
+    assert hashing_threads[0].startswith("sdss-hash")
+
+
+def test_targets_carry_precomputed_download_locations():
+    entry = sdss._resolve_target("6138-56598-0934")
+
+    assert entry.filename == "spec-6138-56598-0934.fits"
+    assert entry.remote_url == sdss._remote_url(6138, 56598, 934)
+    assert entry.remote_url == f"{sdss.BASE_URL}/6138/spec-6138-56598-0934.fits"
+
+
+def test_effective_range_computed_once_for_cached_spectrum(monkeypatch, tmp_path):
+    body = _spectrum_bytes()
+    monkeypatch.setattr(
+        sdss._SESSION, "get", lambda url, *args, **kwargs: _StreamingResponse(body)
+    )
+    calls: List[int] = []
+    original_range = sdss.flux_percentile_range
+
+    def counting_range(wavelength, flux, **kwargs):
+        calls.append(len(wavelength))
+        return original_range(wavelength, flux, **kwargs)
+
+    monkeypatch.setattr(sdss, "flux_percentile_range", counting_range)
+
+    first = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+    second = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+
+    assert calls == [16]
+    effective = second["meta"]["wavelength_effective_range_nm"]
+    assert effective == first["meta"]["wavelength_effective_range_nm"]
+    assert all(type(value) is float for value in effective)
+
+
+def test_force_refresh_revalidates_with_stored_validators(monkeypatch, tmp_path):
+    body = _spectrum_bytes()
+    requests_seen: List[dict] = []
+    responses = [
+        _StreamingResponse(
+            body,
+            headers={"ETag": '"abc"', "Last-Modified": "Tue, 01 Mar 2022 00:00:00 GMT"},
+        ),
+        _StreamingResponse(b"", status_code=304),
+    ]
+
+    def fake_get(url, *args, headers=None, **kwargs):
+        requests_seen.append(dict(headers or {}))
+        return responses.pop(0)
+
+    monkeypatch.setattr(sdss._SESSION, "get", fake_get)
+
+    first = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+    refreshed = sdss.fetch("6138-56598-0934", cache_dir=tmp_path, force_refresh=True)
+
+    assert requests_seen[0] == {}
+    assert requests_seen[1] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 01 Mar 2022 00:00:00 GMT",
+    }
+    assert refreshed["meta"]["cache_hit"] is True
+    assert refreshed["meta"]["file_hash_sha256"] == first["meta"]["file_hash_sha256"]
+    assert Path(refreshed["meta"]["cache_path"]).read_bytes() == body
+
+
+def test_force_refresh_without_validators_downloads_again(monkeypatch, tmp_path):
+    body = _spectrum_bytes()
+    requests_seen: List[dict] = []
+
+    def fake_get(url, *args, headers=None, **kwargs):
+        requests_seen.append(dict(headers or {}))
+        return _StreamingResponse(body)
+
+    monkeypatch.setattr(sdss._SESSION, "get", fake_get)
+
+    sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+    refreshed = sdss.fetch("6138-56598-0934", cache_dir=tmp_path, force_refresh=True)
+
+    assert requests_seen == [{}, {}]
+    assert refreshed["meta"]["cache_hit"] is False
+
+
+def test_access_url_matches_on_download_and_cache_hit(monkeypatch, tmp_path):
+    body = _spectrum_bytes()
+    urls: List[str] = []
+
+    def fake_get(url, *args, **kwargs):
+        urls.append(url)
+        return _StreamingResponse(body)
+
+    monkeypatch.setattr(sdss._SESSION, "get", fake_get)
+
+    downloaded = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+    cached = sdss.fetch("6138-56598-0934", cache_dir=tmp_path)
+
+    expected = sdss._resolve_target("6138-56598-0934").remote_url
+    assert urls == [expected]
+    assert downloaded["meta"]["access_url"] == cached["meta"]["access_url"] == expected
+
+
+@pytest.mark.parametrize("use_file_digest", [True, False])
+def test_sha256_matches_hashlib(monkeypatch, tmp_path, use_file_digest):
+    path = tmp_path / "blob.bin"
+    data = bytes(range(256)) * 9000
+    path.write_bytes(data)
+    if not use_file_digest:
+        monkeypatch.delattr(sdss.hashlib, "file_digest", raising=False)
+
+    assert sdss._sha256(path) == hashlib.sha256(data).hexdigest()
+
+
+def test_parse_returns_float64_arrays_without_extra_casts(tmp_path):
+    path = tmp_path / "spec.fits"
+    path.write_bytes(_spectrum_bytes())
+
+    spectrum = sdss._parse_sdss_spectrum(path)
+
+    for key in ("wavelength_nm", "flux", "uncertainty"):
+        array = spectrum[key]
+        assert array.dtype == np.float64
+        assert array.flags.c_contiguous
+        assert array.flags.owndata
+
+
+def test_resolve_target_by_identifiers():
+    entry = sdss._resolve_target("", plate="2821", mjd=54393, fiber=134)
+
+    assert entry.canonical_name == "Gaia DR3 2050891968120836864"
+    # Unknown identifiers fall through to the name lookup.
+    assert sdss._resolve_target("3128-54776-0178", plate=1, mjd=2, fiber=3).plate == 3128
@@ -110,6 +110,57 @@ def test_ingest_local_ascii_multiple_flux_columns():
     assert "Velocity (km/s)" not in labels
 
 
+def test_parse_ascii_aligns_extra_traces_with_valid_rows():
+    dataframe = pd.DataFrame(
+        {
+            "Wavelength (nm)": ["400", "405", "bad", "415", "420", "425"],
+            "Flux (arb)": [0.1, None, 0.3, 0.4, 0.5, 0.6],
+            "Model Flux (arb)": [1.0, 2.0, 3.0, "n/a", 5.0, 6.0],
+            "Notes": ["a", "b", "c", "d", "e", "f"],
+        }
+    )
+
+    parsed = parse_ascii(dataframe, content_bytes=b"aligned", filename="aligned.csv")
+
+    assert parsed["wavelength_nm"] == [400.0, 415.0, 420.0, 425.0]
+    assert parsed["flux"] == [0.1, 0.4, 0.5, 0.6]
+    (extra,) = parsed["additional_traces"]
+    assert extra["label"] == "Model Flux (arb)"
+    assert extra["wavelength_nm"] == [400.0, 420.0, 425.0]
+    assert extra["flux"] == [1.0, 5.0, 6.0]
+    # Trace metadata layers its own point count over the shared file metadata.
+    assert extra["metadata"]["points"] == 3
+    assert extra["metadata"].maps[1] is parsed["metadata"]
+    assert parsed["metadata"]["points"] == 4
+    assert dict(extra["metadata"]) == {**parsed["metadata"], "points": 3}
+
+
+def test_parse_ascii_coerces_only_spectral_and_flux_like_columns(monkeypatch):
+    from app.server import ingest_ascii
+
+    coerced = []
+    real_to_numeric = pd.to_numeric
+
+    def recording_to_numeric(values, *args, **kwargs):
+        coerced.append(getattr(values, "name", None))
+        return real_to_numeric(values, *args, **kwargs)
+
+    monkeypatch.setattr(ingest_ascii.pd, "to_numeric", recording_to_numeric)
+    dataframe = pd.DataFrame(
+        {
+            "Wavelength (nm)": [400.0, 405.0, 410.0],
+            "Flux (arb)": [0.1, 0.2, 0.3],
+            "Model Flux (arb)": [1.0, 2.0, 3.0],
+            "Temperature (K)": [5000, 5050, 5100],
+            "Notes": ["a", "b", "c"],
+        }
+    )
+
+    parse_ascii(dataframe, content_bytes=b"wide", filename="wide.csv")
+
+    assert sorted(coerced) == ["Flux (arb)", "Model Flux (arb)", "Wavelength (nm)"]
+
+
 def test_ingest_local_ascii_filters_non_flux_numeric_columns():
     content = dedent(
         """
@@ -212,6 +263,228 @@ def test_ingest_local_ascii_prefers_flux_keyword_variants(columns, expected):
     assert parsed["metadata"]["flux_column"] == expected
 
 
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("Balmer Flux (arb)", True),
+        ("Spectral_Irradiance", True),
+        ("Température (K)", False),
+        ("Flux—modèle", True),
+        ("Radial Velocity (km/s)", False),
+        (3, False),
+    ],
+)
+def test_is_flux_like_label_tokenises_ascii_and_unicode(label, expected):
+    from app.server import ingest_ascii
+
+    assert ingest_ascii._is_flux_like_label(label) is expected
+    assert ingest_ascii._is_flux_like_label(label) is expected
+    assert ingest_ascii._is_flux_like_text.cache_info().hits >= 1
+
+
+@pytest.mark.parametrize(
+    "label, expected",
+    [
+        ("Fluxdensity", True),
+        ("Normalised Luminosity", True),
+        ("Photon counts", True),
+        ("Sky (ergs/s/cm^2/A)", True),
+        ("Model (Jansky)", True),
+        ("Column 4 (photons)", True),
+        ("Exposure (s)", False),
+        ("Column 4", False),
+    ],
+)
+def test_is_flux_like_label_scans_reduced_keyword_tuples(label, expected):
+    from app.server import ingest_ascii
+
+    assert "fluxdens" not in ingest_ascii._FLUX_LABEL_SUBSTRING_SCAN
+    assert "ergs" not in ingest_ascii._FLUX_UNIT_SUBSTRING_SCAN
+    ingest_ascii._is_flux_like_text.cache_clear()
+    assert ingest_ascii._is_flux_like_label(label) is expected
+
+
+@pytest.mark.parametrize(
+    "unit, expected",
+    [
+        ("Arbitrary Units", ("Arbitrary Units", "relative")),
+        ("counts/s", ("counts/s", "relative")),
+        ("Normalized", ("Normalized", "relative")),
+        ("erg/s/cm^2/A", ("erg/s/cm^2/A", "absolute")),
+        ("  ", ("arb", "relative")),
+    ],
+)
+def test_normalise_flux_unit_scans_module_level_relative_tokens(unit, expected):
+    from app.server import ingest_ascii
+
+    assert ingest_ascii._RELATIVE_FLUX_UNIT_SCAN == ("adu", "arb", "norm", "count", "relative")
+    ingest_ascii._normalise_flux_unit.cache_clear()
+    assert ingest_ascii._normalise_flux_unit(unit) == expected
+
+
+def test_detect_columns_reuses_result_for_repeated_schema():
+    from app.server import ingest_ascii
+
+    ingest_ascii._detect_column_labels.cache_clear()
+    columns = ["Index", "Wavelength (nm)", "Sun", "Spectral Irradiance (W/m^2/nm)"]
+    first = ingest_ascii._detect_columns(pd.DataFrame(columns=columns))
+    second = ingest_ascii._detect_columns(pd.DataFrame([[0, 1, 2, 3]], columns=columns))
+
+    assert first == second == ("Wavelength (nm)", "Spectral Irradiance (W/m^2/nm)")
+    assert ingest_ascii._detect_column_labels.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("Instrument", "instrument"),
+        ("  Obs. Date (UTC) ", "obs_date_utc"),
+        ("__DATE--OBS__", "date_obs"),
+        ("Wavelength μm", "wavelength_m"),
+        ("Température", "temp_rature"),
+        ("---", ""),
+    ],
+)
+def test_normalise_header_key_collapses_separators(key, expected):
+    from app.server import ingest_ascii
+
+    assert ingest_ascii._normalise_header_key(key) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (" NM ", "nm"),
+        ("Angstroms", "Å"),
+        ("μm", "µm"),
+        ("CM-1", "cm^-1"),
+        ("Wavelength (nm)", "nm"),
+        ("wave_um", "µm"),
+        ("Wavenumber", "cm^-1"),
+        ("Flux", None),
+    ],
+)
+def test_extract_unit_hint_direct_and_scanned_labels(text, expected):
+    from app.server import ingest_ascii
+
+    assert ingest_ascii._extract_unit_hint(text) == expected
+
+
+def test_label_normalisers_are_memoised():
+    from app.server import ingest_ascii
+
+    for cached in (
+        ingest_ascii._unit_hint_for,
+        ingest_ascii._normalise_flux_unit,
+        ingest_ascii._normalise_header_key,
+    ):
+        cached.cache_clear()
+    for _ in range(2):
+        assert ingest_ascii._extract_unit_hint("Wavelength (Angstrom)") == "Å"
+        assert ingest_ascii._normalise_flux_unit(" Counts ") == ("Counts", "relative")
+        assert ingest_ascii._normalise_header_key("Flux Unit") == "flux_unit"
+
+    assert ingest_ascii._unit_hint_for.cache_info().hits == 1
+    assert ingest_ascii._normalise_flux_unit.cache_info().hits == 1
+    assert ingest_ascii._normalise_header_key.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("3500 .. 9000 Angstrom", (350.0, 900.0)),
+        ("1.2e3, 2.4e3, 9 nm", (1200.0, 2400.0)),
+        ("700 to 400", (400.0, 700.0)),
+        ("500 nm", None),
+        ("500 - 500", None),
+    ],
+)
+def test_parse_range_value_uses_first_two_numbers(value, expected):
+    from app.server import ingest_ascii
+
+    result = ingest_ascii._parse_range_value(value, "nm")
+
+    assert result == (pytest.approx(expected) if expected else None)
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("# Instrument: ExampleSpec", ("Instrument", "ExampleSpec")),
+        ("DATE-OBS = 2020-01-01T10:30", ("DATE-OBS = 2020-01-01T10", "30")),
+        ("EXPTIME = 30", ("EXPTIME", "30")),
+        ("Observer\tAna", ("Observer", "Ana")),
+        ("## Target Vega", ("Target", "Vega")),
+        ("#", None),
+        ("Lonely", None),
+    ],
+)
+def test_split_header_line_keeps_separator_priority(line, expected):
+    from app.server import ingest_ascii
+
+    assert ingest_ascii._split_header_line(line) == expected
+
+
+def test_collect_header_metadata_dispatches_aliases():
+    from app.server import ingest_ascii
+
+    metadata, raw, labels, axis, wavelength_unit, flux_unit = ingest_ascii._collect_header_metadata(
+        [
+            "# Instrument: ExampleSpec",
+            "# Object: Vega",
+            "# Title: Vega spectrum",
+            "# Flux Unit: erg/s/cm2/A",
+            "# Flux Unit: Jy",
+            "# Wavelength Unit: Angstrom",
+            "# Axis: emission",
+            "# Exposure: 30",
+        ]
+    )
+
+    assert metadata["instrument"] == "ExampleSpec"
+    assert metadata["flux_unit"] == metadata["reported_flux_unit"] == "erg/s/cm2/A"
+    assert metadata["exposure"] == "30"
+    assert raw["flux_unit"] == "Jy"
+    assert labels == ["Vega", "Vega spectrum"]
+    assert (axis, flux_unit) == ("emission", "erg/s/cm2/A")
+    assert wavelength_unit == ingest_ascii._extract_unit_hint("Angstrom")
+
+
+def test_checksum_bytes_accepts_buffer_views():
+    import hashlib
+
+    from app.server.ingest_ascii import checksum_bytes
+
+    payload = b"500 1.0\n501 2.0\n" * 64
+    expected = hashlib.sha256(payload).hexdigest()
+
+    assert checksum_bytes(payload) == expected
+    assert checksum_bytes(bytearray(payload)) == expected
+    assert checksum_bytes(memoryview(b"xx" + payload)[2:]) == expected
+
+
+def test_segment_checksum_requests_non_security_digest(monkeypatch):
+    import hashlib
+
+    from app.server import ingest_ascii
+
+    calls = []
+    real_sha256 = hashlib.sha256
+
+    def recording_sha256(*args, **kwargs):
+        calls.append(kwargs.get("usedforsecurity"))
+        return real_sha256(*args, **kwargs)
+
+    monkeypatch.setattr(ingest_ascii.hashlib, "sha256", recording_sha256)
+    payload = b"500 1.0 0.1\n501 2.0 0.2\n"
+
+    parsed = parse_ascii_segments([("a.txt", payload)], root_filename="a.txt")
+
+    assert parsed["provenance"]["checksum"] == real_sha256(payload).hexdigest()
+    assert ingest_ascii.checksum_bytes(payload) == parsed["provenance"]["checksum"]
+    assert calls == [False, False]
+
+
 def test_parse_ascii_segments_handles_variable_whitespace():
     segment = dedent(
         """
@@ -235,7 +508,254 @@ def test_parse_ascii_segments_handles_variable_whitespace():
     assert metadata["flux_unit"] == "relative"
     assert metadata["dense_chunk_size"] == 2
     assert parsed["downsample"]
-    assert parsed["provenance"]["chunks"]
+    assert parsed["provenance"]["chunks"] == [
+        {"offset": 0, "start_nm": 380.0, "end_nm": 380.5, "samples": 2},
+        {"offset": 2, "start_nm": 381.0, "end_nm": 381.0, "samples": 1},
+    ]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"# Units: nm\nwave flux\n500 1.0\n501 2.0\n\n502 3.0\n",
+        b"header\r\n  500\t1.0 0.1\r\n 501   2.0\r\n",
+        b"500 1.0 0.1\n501 2.5e-3 0.2\n",
+        b"# Date: 2020-01-01\n5.0D+02 1.0d-01\n5.01D+02 2.0D0\n",
+        b"# Observer: Ana\xefs \xb5m\r\n500 1.0\r\n501 2.0\r\n",
+        "\u0661 \u0662\nInfo: 7 8\n\u00a0\n500 1.0\n501 2.0\n".encode("utf-8"),
+    ],
+)
+def test_dense_segment_bulk_parser_matches_line_parser(payload):
+    from app.server import ingest_ascii
+
+    bulk = ingest_ascii._parse_dense_segment_bulk(payload)
+    lines = ingest_ascii._parse_dense_segment_lines(payload)
+
+    assert bulk is not None
+    assert bulk[0] == lines[0]
+    assert bulk[4] == lines[4] == 0
+    for bulk_values, line_values in zip(bulk[1:4], lines[1:4]):
+        np.testing.assert_array_equal(bulk_values, line_values)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"500 1.0\n501\n502 3.0\n",
+        b"500 1.0 x\n501 2.0 0.1\n",
+        b"500 1.0\nnote 2\n501 2.0\n",
+    ],
+)
+def test_dense_segment_irregular_rows_use_line_parser(payload):
+    from app.server import ingest_ascii
+
+    assert ingest_ascii._parse_dense_segment_bulk(payload) is None
+    parsed = parse_ascii_segments([("segment.txt", payload)], chunk_size=10)
+    assert parsed["wavelength_nm"][0] == 500.0
+
+
+def test_dense_segment_line_parser_fixes_exponents_per_row_only():
+    from app.server import ingest_ascii
+
+    payload = b"Detector: ddD\n5.0D+02 1.0d-01 x\n5.01D+02\n5.02d2 2.0D0 3d-1\n"
+
+    headers, wavelengths, flux, auxiliary, skipped = ingest_ascii._parse_dense_segment_lines(
+        payload
+    )
+
+    assert headers == ["Detector: ddD"]
+    assert wavelengths.tolist() == [500.0, 502.0]
+    assert flux.tolist() == [0.1, 2.0]
+    assert np.isnan(auxiliary[0]) and auxiliary[1] == 0.3
+    assert skipped == 1
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"500 1.0\n# interleaved comment\n501 2.0\n",
+        b"# header\r\n500 1.0 0.1\r\n  ! marker\r\n501 2.0 0.2\r\nEND\r\n",
+    ],
+)
+def test_dense_segment_bulk_parser_strips_interleaved_text_rows(payload):
+    from app.server import ingest_ascii
+
+    bulk = ingest_ascii._parse_dense_segment_bulk(payload)
+    lines = ingest_ascii._parse_dense_segment_lines(payload)
+
+    assert bulk is not None
+    assert bulk[0] == lines[0]
+    assert bulk[4] == lines[4] > 0
+    for bulk_values, line_values in zip(bulk[1:4], lines[1:4]):
+        np.testing.assert_array_equal(bulk_values, line_values)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"500 1.0\n501 2.0 0.1\n502 3.0\n",
+        b"500 1.0 0.1 7 8\n501 2.0\n502 3.0 0.3 x\n",
+        b"500 1.0\n# note\n501 2.0 0.1\n",
+    ],
+)
+def test_dense_segment_bulk_parser_reads_ragged_rows(payload):
+    from app.server import ingest_ascii
+
+    bulk = ingest_ascii._parse_dense_segment_bulk(payload)
+    lines = ingest_ascii._parse_dense_segment_lines(payload)
+
+    assert bulk is not None
+    assert bulk[0] == lines[0]
+    assert bulk[4] == lines[4]
+    for bulk_values, line_values in zip(bulk[1:4], lines[1:4]):
+        np.testing.assert_array_equal(bulk_values, line_values)
+
+
+def test_dense_segment_bulk_parser_leaves_bare_cr_rows_to_line_parser():
+    from app.server import ingest_ascii
+
+    payload = b"500 1.0\n# note\r501 2.0\n"
+
+    assert ingest_ascii._parse_dense_segment_bulk(payload) is None
+
+
+def test_grow_buffer_extends_past_estimate():
+    from app.server import ingest_ascii
+
+    buffer = ingest_ascii._GrowBuffer(2)
+    for value in range(40):
+        buffer.append(float(value))
+
+    np.testing.assert_array_equal(buffer.view(), np.arange(40, dtype=float))
+
+
+def test_parse_ascii_segments_keeps_first_sample_of_duplicate_wavelengths():
+    payload = b"500 1.0\n501 2.0\n500 9.0\n502 3.0\n501 8.0\n"
+
+    parsed = parse_ascii_segments([("dupes.txt", payload)], chunk_size=10)
+
+    assert parsed["wavelength_nm"] == [500.0, 501.0, 502.0]
+    assert parsed["flux"] == [1.0, 2.0, 3.0]
+    assert parsed["provenance"]["dense_parser"]["deduplicated_samples"] == 2
+
+
+@pytest.mark.parametrize(
+    "rows, expected",
+    [
+        ([(500, 1.0), (501, 2.0), (502, 3.0)], [500.0, 501.0, 502.0]),
+        ([(502, 3.0), (501, 2.0), (500, 1.0)], [500.0, 501.0, 502.0]),
+        ([(501, 2.0), (500, 1.0), (502, 3.0)], [500.0, 501.0, 502.0]),
+    ],
+)
+def test_parse_ascii_segments_orders_monotonic_and_shuffled_input(rows, expected):
+    payload = "".join(f"{wave} {flux}\n" for wave, flux in rows).encode()
+
+    parsed = parse_ascii_segments([("ordered.txt", payload)], chunk_size=10)
+
+    assert parsed["wavelength_nm"] == expected
+    assert parsed["flux"] == [value - 499.0 for value in expected]
+
+
+def test_parse_ascii_segments_filters_sorts_and_dedups_in_one_gather():
+    first = b"503 3.0 0.3\n501 1.0 0.1\nnan 7.0 0.7\n"
+    second = b"502 2.0 0.2\n501 9.0 0.9\n504 nan 0.4\n500 0.0 0.0\n"
+
+    parsed = parse_ascii_segments([("a.txt", first), ("b.txt", second)], chunk_size=10)
+
+    assert parsed["wavelength_nm"] == [500.0, 501.0, 502.0, 503.0]
+    assert parsed["flux"] == [0.0, 1.0, 2.0, 3.0]
+    assert parsed["provenance"]["dense_parser"]["deduplicated_samples"] == 1
+    stats = parsed["metadata"]["auxiliary_statistics"]
+    assert (stats["min"], stats["max"], stats["samples"]) == (0.0, 0.3, 4)
+    assert stats["mean"] == pytest.approx(0.15)
+
+
+def test_parse_ascii_segments_threaded_matches_sequential():
+    segments = [
+        ("a.txt", b"# Source: Atlas\n500 1.0\n501 2.0\n"),
+        ("b.txt", b"502 3.0 0.3\n# note\n503 4.0 0.4\n"),
+        ("c.txt", b"504 5.0\n505\n506 6.0\n"),
+    ]
+
+    sequential = parse_ascii_segments(segments, chunk_size=10, max_workers=1)
+    threaded = parse_ascii_segments(segments, chunk_size=10, max_workers=3)
+
+    assert threaded["wavelength_nm"] == sequential["wavelength_nm"]
+    assert threaded["flux"] == sequential["flux"]
+    assert threaded["provenance"]["checksum"] == sequential["provenance"]["checksum"]
+    assert threaded["provenance"]["segments"] == sequential["provenance"]["segments"]
+    assert threaded["provenance"]["dense_parser"] == sequential["provenance"]["dense_parser"]
+
+
+@pytest.mark.parametrize(
+    "payload, expected_sorts",
+    [
+        (b"500 1.0\n501 2.0\n501 9.0\n502 3.0\n", 0),
+        (b"502 3.0\n501 2.0\n500 1.0\n", 0),
+        (b"501 2.0\n500 1.0\n502 3.0\n500 9.0\n", 1),
+    ],
+)
+def test_parse_ascii_segments_sorts_and_dedups_with_at_most_one_sort(
+    monkeypatch, payload, expected_sorts
+):
+    from app.server import ingest_ascii
+
+    calls = {"argsort": 0}
+    real_argsort = np.argsort
+
+    def counting_argsort(*args, **kwargs):
+        calls["argsort"] += 1
+        return real_argsort(*args, **kwargs)
+
+    def forbidden_unique(*args, **kwargs):  # pragma: no cover - guard
+        raise AssertionError("dedup must not re-sort through np.unique")
+
+    monkeypatch.setattr(ingest_ascii.np, "argsort", counting_argsort)
+    monkeypatch.setattr(ingest_ascii.np, "unique", forbidden_unique)
+
+    parsed = parse_ascii_segments([("sorted.txt", payload)], chunk_size=10)
+
+    assert parsed["wavelength_nm"] == [500.0, 501.0, 502.0]
+    assert parsed["flux"][1] == 2.0
+    assert calls["argsort"] == expected_sorts
+
+
+def test_downsample_sorted_unique_matches_numpy_unique():
+    from app.utils import downsample
+
+    rng = np.random.default_rng(7)
+    x = rng.integers(0, 50, 400).astype(float)
+    y = rng.random(400)
+
+    order = np.argsort(x, kind="mergesort")
+    expected_x, first = np.unique(x[order], return_index=True)
+    expected_y = y[order][first]
+
+    for wavelengths, flux in ((x, y), (expected_x, expected_y)):
+        got_x, got_y = downsample._ensure_sorted_unique(wavelengths, flux)
+        np.testing.assert_array_equal(got_x, expected_x)
+        np.testing.assert_array_equal(got_y, expected_y)
+
+
+def test_downsample_packs_strided_views_before_bucketing():
+    from app.utils import downsample
+
+    grid = np.linspace(400.0, 900.0, 6000)
+    table = np.column_stack([grid, np.sin(grid / 7.0)])
+    x_view, y_view = table[:, 0], table[:, 1]
+    assert not x_view.flags.c_contiguous
+
+    packed_x, packed_y = downsample._ensure_sorted_unique(x_view, y_view)
+    assert packed_x.flags.c_contiguous and packed_y.flags.c_contiguous
+
+    contiguous = np.ascontiguousarray(x_view)
+    assert downsample._as_float_array(contiguous) is contiguous
+
+    strided = downsample.build_downsample_tiers(x_view, y_view, strategy="lttb")
+    packed = downsample.build_downsample_tiers(
+        np.ascontiguousarray(x_view), np.ascontiguousarray(y_view), strategy="lttb"
+    )
+    assert strided == packed
 
 
 def test_parse_ascii_segments_converts_angstrom_to_nm():
@@ -279,6 +799,56 @@ def test_parse_ascii_segments_wavenumber_sorted_to_nm():
     assert dense.get("unique_samples") == 2
 
 
+def test_read_table_uses_c_engine_with_python_fallback(monkeypatch):
+    from app.utils import io_readers
+
+    engines = []
+    original = pd.read_csv
+
+    def recording_read_csv(*args, **kwargs):
+        engines.append(kwargs.get("engine"))
+        if kwargs.get("engine") == "c" and fail_c_engine:
+            raise pd.errors.ParserError("rejected by the C tokenizer")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(io_readers.pd, "read_csv", recording_read_csv)
+    payload = b"# comment\nwavelength,flux\n500,1.0\n501,1.5\n\n502,2.0\n"
+
+    fail_c_engine = False
+    table = io_readers.read_table(payload, include_header=True)
+    assert engines == ["c"]
+    assert table.column_labels == ["wavelength", "flux"]
+    assert table.dataframe["flux"].tolist() == [1.0, 1.5, 2.0]
+
+    engines.clear()
+    fail_c_engine = True
+    fallback = io_readers.read_table(payload, include_header=True)
+    assert engines == ["c", "python"]
+    assert fallback.dataframe.equals(table.dataframe)
+
+
+def test_read_table_coerces_only_text_bearing_spectral_columns(monkeypatch):
+    from app.utils import io_readers
+
+    coerced = []
+    original = pd.to_numeric
+
+    def recording_to_numeric(values, *args, **kwargs):
+        coerced.append(values.name)
+        return original(values, *args, **kwargs)
+
+    monkeypatch.setattr(io_readers.pd, "to_numeric", recording_to_numeric)
+
+    clean = io_readers.read_table(b"wavelength,flux,note\n500,1.0,a\n501,1.5,b\n")
+    assert coerced == []
+    assert clean["flux"].tolist() == [1.0, 1.5]
+
+    noisy = io_readers.read_table(b"wavelength,flux,note\n500,1.0,a\n501,bad,b\n502,2.0,c\n")
+    assert coerced == ["flux"]
+    assert noisy["wavelength"].tolist() == [500, 502]
+    assert noisy["flux"].tolist() == [1.0, 2.0]
+
+
 def test_ingest_local_ascii_vertical_layout():
     content = dedent(
         """
@@ -402,6 +972,67 @@ def test_ingest_local_jcamp_xydata_skips_uncertainty():
     assert payload_txt["provenance"]["format"] == "jcamp"
 
 
+def test_parse_jcamp_numeric_records_fill_section_context():
+    from app.server.ingest_jcamp import parse_jcamp
+
+    content = dedent(
+        """
+        ##TITLE=Context
+        ##ORIGIN=Lab 7
+        ##XUNITS=NANOMETERS
+        ##YUNITS=Absorbance
+        ##XFACTOR=2
+        ##YFACTOR=0.5
+        ##FIRSTY=1.0D0
+        ##NPOINTS=3.2
+        ##PATH LENGTH=0.1
+        ##MOLFRAC=bad
+        ##XYPOINTS=(XY..XY)
+        250 2
+        251 4
+        252 6
+        ##END=
+        """
+    ).strip().encode("utf-8")
+
+    payload = parse_jcamp(content, filename="context.jdx")
+    metadata = payload["metadata"]
+
+    assert payload["wavelength_nm"] == pytest.approx([500.0, 502.0, 504.0])
+    assert payload["flux"] == pytest.approx([1.0, 2.0, 3.0])
+    assert metadata["reported_points"] == 3
+    assert metadata["reported_first_y"] == 1.0
+    assert metadata["path_length_reported_m"] == 0.1
+    assert "mole_fraction_reported" not in metadata
+    assert metadata["origin"] == "Lab 7"
+
+
+def test_parse_jcamp_range_uses_plain_reductions_on_finite_samples(monkeypatch):
+    from app.server import ingest_jcamp
+
+    def forbidden(*args, **kwargs):  # pragma: no cover - guard
+        raise AssertionError("samples are already finite")
+
+    monkeypatch.setattr(ingest_jcamp.np, "nanmin", forbidden)
+    monkeypatch.setattr(ingest_jcamp.np, "nanmax", forbidden)
+    content = dedent(
+        """
+        ##TITLE=Unordered
+        ##XUNITS=NANOMETERS
+        ##YUNITS=Absorbance
+        ##XYPOINTS=(XY..XY)
+        502 1 500 2
+        504 4 501 5
+        ##END=
+        """
+    ).strip().encode("utf-8")
+
+    payload = ingest_jcamp.parse_jcamp(content, filename="unordered.jdx")
+
+    assert payload["wavelength_nm"] == [502.0, 500.0, 504.0, 501.0]
+    assert payload["metadata"]["wavelength_range_nm"] == [500.0, 504.0]
+
+
 def test_ingest_local_ascii_gzip_round_trip():
     content = gzip.compress(
         dedent(
@@ -757,4 +1388,26 @@ def test_ingest_local_image_returns_image_payload(tmp_path):
     assert payload.get("image", {}).get("shape") == [3, 3]
     assert payload["metadata"].get("image_shape") == [3, 3]
     assert payload["summary"].startswith("3 × 3 image")
-    assert payload["provenance"].get("axis_kind") == "image"
\ No newline at end of file
+    assert payload["provenance"].get("axis_kind") == "image"
+
+
+def test_parse_ascii_segments_downsample_reuses_tier_tuples(monkeypatch):
+    from app.server import ingest_ascii
+
+    captured = {}
+    original = ingest_ascii.build_downsample_tiers
+
+    def _spy(*args, **kwargs):
+        tiers = original(*args, **kwargs)
+        captured.update(tiers)
+        return tiers
+
+    monkeypatch.setattr(ingest_ascii, "build_downsample_tiers", _spy)
+    segment = "\n".join(f"{400 + idx} {idx * 0.5} 0.1" for idx in range(50)).encode("utf-8")
+
+    parsed = parse_ascii_segments([("tiers.txt", segment)], root_filename="tiers.txt")
+
+    assert parsed["downsample"]
+    for level, tier in parsed["downsample"].items():
+        assert tier["wavelength_nm"] is captured[level].wavelength_nm
+        assert tier["flux"] is captured[level].flux
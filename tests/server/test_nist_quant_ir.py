@@ -1,11 +1,12 @@
+from textwrap import dedent
+
 import pytest
 from astropy import units as u
 
 from app.server.fetchers import nist_quant_ir
 
 
-def test_parse_catalog_extracts_species_and_resolutions():
-    html = """
+_CATALOG_HTML = """
     <table class="list">
       <tr>
         <th>Species</th><th>Relative</th><th>Apodization</th><th>Resolution</th>
@@ -35,7 +36,10 @@ def test_parse_catalog_extracts_species_and_resolutions():
       </tr>
     </table>
     """
-    catalog = nist_quant_ir._parse_catalog(html)
+
+
+def test_parse_catalog_extracts_species_and_resolutions():
+    catalog = nist_quant_ir._parse_catalog(_CATALOG_HTML)
     assert "benzene" in catalog
     benzene = catalog["benzene"]
     assert benzene.name == "Benzene"
@@ -182,3 +186,336 @@ def test_finalise_payload_preserves_samples_and_tags_units():
     units_meta = provenance.get("units")
     assert units_meta["preferred_wavelength"] == "cm^-1"
     assert "wavenumber_cm_1" in payload
+
+
+def test_finalise_payload_accepts_ndarray_samples():
+    np = pytest.importorskip("numpy")
+    wavelengths = np.array([500.0, 1000.0, 2000.0])
+    payload = {
+        "wavelength_nm": wavelengths,
+        "flux": np.array([0.1, 0.2, 0.3]),
+        "metadata": {},
+        "provenance": {},
+    }
+
+    nist_quant_ir._finalise_payload(payload)
+
+    assert payload["wavenumber_cm_1"] == pytest.approx([20000.0, 10000.0, 5000.0])
+
+
+_WATER_JCAMP = (
+    b"##TITLE=Water\n"
+    b"##JCAMP-DX=4.24\n"
+    b"##DATA TYPE=INFRARED SPECTRUM\n"
+    b"##XUNITS=1/CM\n"
+    b"##YUNITS=TRANSMITTANCE\n"
+    b"##DELTAX=1\n"
+    b"##XYDATA=(X++(Y..Y))\n"
+    b"1000 0.9 0.8 0.7 0.6\n"
+    b"##END=\n"
+)
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.urls: list[str] = []
+
+    def get(self, url, timeout=None, **kwargs):
+        import requests
+
+        self.urls.append(url)
+        if url == nist_quant_ir.CATALOG_URL:
+            raise requests.ConnectionError("catalog offline")
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = _WATER_JCAMP
+        response._content_consumed = True
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def test_fetch_direct_jcamp_page_downloads_once():
+    session = _RecordingSession()
+
+    payload = nist_quant_ir.fetch(species="Water", session=session)
+
+    water_url = "https://webbook.nist.gov/cgi/cbook.cgi?JCAMP=C7732185&Index=1&Type=IR"
+    assert session.urls.count(water_url) == 1
+    assert payload["metadata"]["jcamp_url"] == water_url
+    assert payload["metadata"]["source_delta_x_cm_1"] == pytest.approx(1.0)
+    assert len(payload["wavelength_nm"]) == 4
+
+
+def test_manual_catalog_shares_species_across_aliases():
+    manual_catalog = nist_quant_ir.manual_species_catalog()
+
+    water = manual_catalog[nist_quant_ir._normalise_token("Water")]
+
+    assert manual_catalog[nist_quant_ir._normalise_token("H2O")] is water
+    assert manual_catalog[nist_quant_ir._normalise_token("7732-18-5")] is water
+
+
+def test_merge_manual_species_prefers_parsed_entries():
+    parsed = {
+        "water": nist_quant_ir.QuantIRSpecies(
+            name="Water",
+            relative_uncertainty="1.0 %",
+            measurements=(),
+        )
+    }
+
+    merged = nist_quant_ir._merge_manual_species(parsed)
+
+    assert merged["water"] is parsed["water"]
+    assert merged.get("methane") is not None
+    assert "water" in nist_quant_ir.manual_species_catalog()
+    assert nist_quant_ir.manual_species_catalog()["water"] is not parsed["water"]
+
+
+def test_available_species_lists_sorted_resolutions(monkeypatch):
+    species = nist_quant_ir.QuantIRSpecies(
+        name="benzene",
+        relative_uncertainty="2.1 %",
+        measurements=(
+            nist_quant_ir.QuantIRMeasurement(
+                apodization="Boxcar",
+                resolution_links={0.5: "https://example.invalid/b", 0.125: "https://example.invalid/a"},
+            ),
+        ),
+    )
+    monkeypatch.setattr(
+        nist_quant_ir,
+        "_load_catalog",
+        lambda *, session=None: {"benzene": species, "water": nist_quant_ir.manual_species_catalog()["water"]},
+    )
+
+    entries = nist_quant_ir.available_species()
+
+    assert [entry["name"] for entry in entries] == ["benzene", "Water"]
+    assert entries[0]["measurements"][0]["resolutions_cm_1"] == [0.125, 0.5]
+
+
+def test_choose_measurement_matches_resolution_without_float_noise():
+    species = nist_quant_ir.QuantIRSpecies(
+        name="Benzene",
+        relative_uncertainty="2.1 %",
+        measurements=(
+            nist_quant_ir.QuantIRMeasurement(
+                apodization="Boxcar",
+                resolution_links={0.3: "https://example.invalid/box"},
+            ),
+        ),
+    )
+
+    measurement, resolution, href = nist_quant_ir._choose_measurement(
+        species, resolution_cm_1=0.1 + 0.2, priority=("Boxcar",)
+    )
+
+    assert resolution == 0.3
+    assert href == "https://example.invalid/box"
+    with pytest.raises(nist_quant_ir.QuantIRFetchError):
+        nist_quant_ir._choose_measurement(species, resolution_cm_1=0.25, priority=("Boxcar",))
+
+
+def test_parse_relative_uncertainty_returns_fraction():
+    assert nist_quant_ir._parse_relative_uncertainty("2.1 % relative") == pytest.approx(0.021)
+    assert nist_quant_ir._parse_relative_uncertainty("—") is None
+
+
+def test_fetch_uses_configured_default_session():
+    session = _RecordingSession()
+    nist_quant_ir.configure_session(session)
+    try:
+        nist_quant_ir._download_bytes(
+            "https://webbook.nist.gov/cgi/cbook.cgi?JCAMP=C7732185&Index=1&Type=IR"
+        )
+    finally:
+        nist_quant_ir.configure_session(None)
+
+    assert session.urls == [
+        "https://webbook.nist.gov/cgi/cbook.cgi?JCAMP=C7732185&Index=1&Type=IR"
+    ]
+
+
+def test_fetch_many_returns_payloads_by_species(monkeypatch):
+    calls = []
+
+    def fake_fetch(*, species, session=None, **kwargs):
+        calls.append((species, kwargs.get("resolution_cm_1")))
+        return {"label": species}
+
+    monkeypatch.setattr(nist_quant_ir, "fetch", fake_fetch)
+    monkeypatch.setattr(nist_quant_ir, "_cached_catalog", lambda: {})
+
+    results = nist_quant_ir.fetch_many(
+        ["Water", "Methane", "Water"], max_workers=2, resolution_cm_1=0.5
+    )
+
+    assert list(results) == ["Water", "Methane"]
+    assert results["Methane"] == {"label": "Methane"}
+    assert sorted(calls) == [("Methane", 0.5), ("Water", 0.5)]
+
+
+def test_finalise_payload_reads_wavelength_quantity_buffer():
+    payload = {
+        "wavelength_nm": [1000.0, 2000.0],
+        "wavelength_quantity": [1.0, 2.0] * u.um,
+        "flux": [0.5, 0.6],
+        "metadata": {},
+        "provenance": {},
+    }
+
+    nist_quant_ir._finalise_payload(payload)
+
+    assert payload["wavenumber_cm_1"] == pytest.approx([10000.0, 5000.0])
+
+
+def test_merge_manual_species_routes_aliases_to_parsed_species():
+    parsed_water = nist_quant_ir.QuantIRSpecies(
+        name="Water",
+        relative_uncertainty="1.0 %",
+        measurements=(),
+    )
+
+    merged = nist_quant_ir._merge_manual_species({"water": parsed_water})
+
+    assert merged["h2o"] is parsed_water
+    assert merged["7732185"] is parsed_water
+    assert merged["ch4"] is nist_quant_ir.manual_species_catalog()["methane"]
+
+
+def test_extract_delta_x_falls_back_past_header_window():
+    padding = b"##COMMENT=" + b"x" * 5000 + b"\n"
+    assert nist_quant_ir._extract_delta_x(bytearray(padding + b"##DELTAX=0.5\n")) == pytest.approx(0.5)
+
+
+def test_parse_catalog_regex_path_matches_beautifulsoup():
+    assert nist_quant_ir._catalog_rows_regex(_CATALOG_HTML) is not None
+    assert nist_quant_ir._parse_catalog(_CATALOG_HTML) == nist_quant_ir._parse_catalog_bs(
+        _CATALOG_HTML
+    )
+
+
+def test_parse_catalog_falls_back_for_unclosed_cells():
+    html = _CATALOG_HTML.replace("<td>Triangular</td>", "<td>Triangular")
+
+    assert nist_quant_ir._catalog_rows_regex(html) is None
+    catalog = nist_quant_ir._parse_catalog(html)
+    assert catalog == nist_quant_ir._parse_catalog_bs(html)
+    assert "toluene" in catalog
+
+
+@pytest.mark.parametrize("decoy_class", ["listing", "list-unstyled", "nav listing"])
+def test_parse_catalog_regex_requires_whole_list_class_token(decoy_class):
+    decoy = dedent(
+        f"""
+        <table class="{decoy_class}">
+          <tr><th>Species</th><th>Relative</th><th>Apodization</th><th>Resolution</th></tr>
+          <tr>
+            <td rowspan="1">Bogus</td>
+            <td rowspan="1">1.0 %</td>
+            <td>Boxcar</td>
+            <td><a href="../../cgi/cbook.cgi?ID=1-1-1&amp;Index=QUANT-IR,4">0.125</a></td>
+          </tr>
+        </table>
+        """
+    )
+    html = decoy + _CATALOG_HTML
+
+    catalog = nist_quant_ir._parse_catalog(html)
+
+    assert catalog == nist_quant_ir._parse_catalog_bs(html)
+    assert "bogus" not in catalog
+    assert "benzene" in catalog
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {},
+        {"Content-Length": str(len(_WATER_JCAMP))},
+        {"Content-Length": "10"},
+        {"Content-Length": str(len(_WATER_JCAMP) + 50)},
+        {"Content-Length": "10", "Content-Encoding": "gzip"},
+    ],
+)
+def test_read_body_handles_content_length_variants(headers):
+    import requests
+
+    response = requests.Response()
+    response._content = _WATER_JCAMP
+    response._content_consumed = True
+    response.headers.update(headers)
+
+    body = nist_quant_ir._read_body(response)
+
+    assert bytes(body) == _WATER_JCAMP
+
+
+def test_cached_catalog_revalidates_disk_snapshot(monkeypatch, tmp_path):
+    import requests
+
+    cache_path = tmp_path / "quant_ir_catalog.json"
+    monkeypatch.setattr(nist_quant_ir, "_CATALOG_CACHE_PATH", cache_path)
+    requests_seen = []
+
+    class _CatalogSession:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+        def get(self, url, headers=None, timeout=None):
+            requests_seen.append(dict(headers or {}))
+            response = requests.Response()
+            response.status_code = self.status_code
+            response.url = url
+            response.headers["ETag"] = '"v1"'
+            response._content = _CATALOG_HTML.encode("utf-8") if self.status_code == 200 else b""
+            return response
+
+        def close(self):
+            pass
+
+    try:
+        nist_quant_ir.configure_session(_CatalogSession(200))
+        nist_quant_ir._cached_catalog.cache_clear()
+        first = nist_quant_ir._cached_catalog()
+        assert cache_path.exists()
+
+        nist_quant_ir.configure_session(_CatalogSession(304))
+        nist_quant_ir._cached_catalog.cache_clear()
+        monkeypatch.setattr(
+            nist_quant_ir,
+            "_parse_catalog",
+            lambda html: pytest.fail("304 responses should reuse the disk snapshot"),
+        )
+        second = nist_quant_ir._cached_catalog()
+    finally:
+        nist_quant_ir.configure_session(None)
+        nist_quant_ir._cached_catalog.cache_clear()
+
+    assert requests_seen[0] == {}
+    assert requests_seen[1] == {"If-None-Match": '"v1"'}
+    assert second["benzene"] == first["benzene"]
+    assert second["benzene"].measurements[0].resolution_links[0.25].endswith("Index=QUANT-IR,3#IR-SPEC")
+    assert "methane" in second
+
+
+def test_fetch_reports_manual_aliases():
+    payload = nist_quant_ir.fetch(species="H2O", session=_RecordingSession())
+
+    assert payload["metadata"]["manual_entry"] is True
+    assert payload["metadata"]["aliases"] == ("7732-18-5", "H2O")
+    assert payload["provenance"]["aliases"] == ("7732-18-5", "H2O")
+
+
+def test_finalise_payload_marks_zero_wavelength_as_nan():
+    payload = {"wavelength_nm": [0.0, 1000.0], "flux": [1.0, 1.0], "metadata": {}, "provenance": {}}
+
+    nist_quant_ir._finalise_payload(payload)
+
+    wavenumbers = payload["wavenumber_cm_1"]
+    assert wavenumbers[0] != wavenumbers[0]
+    assert wavenumbers[1] == pytest.approx(10000.0)
@@ -69,3 +69,40 @@ def test_to_nm_zero_wavenumber_raises():
 def test_to_nm_invalid_unit_raises():
     with pytest.raises(ValueError):
         to_nm([1.0], "not-a-unit")
+
+
+def test_resolve_unit_memoises_string_labels():
+    from app.server import units
+
+    units._resolve_unit_text.cache_clear()
+    first = units.resolve_unit("micron")
+    second = units.resolve_unit("micron")
+
+    assert first == second == (u.um, "um")
+    assert units._resolve_unit_text.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("unit", [u.nm, u.AA, u.um, u.imperial.inch])
+def test_to_nm_linear_scale_matches_astropy(unit):
+    values = np.array([0.5, 1.25, 3.0e4])
+    converted, _ = to_nm(values, unit)
+
+    assert converted.unit == u.nm
+    np.testing.assert_array_equal(converted.value, (values * unit).to_value(u.nm))
+    assert not np.shares_memory(converted.value, values)
+
+
+@pytest.mark.parametrize("unit", [u.cm**-1, u.Hz, u.GHz, u.eV])
+def test_to_nm_spectral_converter_matches_astropy(unit):
+    from app.server import units
+
+    units._spectral_nm_converter.cache_clear()
+    values = np.array([0.5, 1.25, 3.0e4])
+    expected = (values * unit).to_value(u.nm, equivalencies=u.spectral())
+
+    for _ in range(2):
+        converted, _ = to_nm(values, unit)
+        assert converted.unit == u.nm
+        np.testing.assert_array_equal(converted.value, expected)
+
+    assert units._spectral_nm_converter.cache_info().hits == 1